@@ -11,11 +11,14 @@ class AppState:
         self.ANNOTATED_ITEMS: Set[str] = set()
         self.INCOMPLETE_ANNOTATIONS: Dict[str, dict] = {}
         self.gspread_client: Optional[gspread.Client] = None
+        self.spreadsheet: Optional[gspread.Spreadsheet] = None  # The spreadsheet that owns `worksheet`
         self.worksheet: Optional[gspread.Worksheet] = None
         self.ACTIVE_FILTERS: Dict[str, Dict[str, Any]] = {}
         self.ACTIVE_LOCKS: Dict[str, Dict[str, Any]] = {} 
         self.currentDataset: Optional[str] = None
         self.SHEET_TEMPLATES: Dict[str, Any] = {}
+        self.AUX_WORKSHEETS: Dict[tuple, gspread.Worksheet] = {}  # (spreadsheet_id, title) -> resolved worksheet handle
+        self.STATS_VERSION: int = 0  # Bumped whenever annotations are written, so cached stats are rebuilt
 
 # Create a single, importable instance of the application state.
 state = AppState()
\ No newline at end of file
@@ -15,6 +15,11 @@ def resource_path(relative_path):
 
 # --- Configuration ---
 LOCK_TIMEOUT_SECONDS = 172800  # 2 hours
+COMMENTS_CACHE_TTL_SECONDS = 30  # How long the dashboard reuses the Comments sheet before re-reading it
+STATS_CACHE_TTL_SECONDS = 30  # How long dashboard stats are served before a background refresh
+SET_LOCK_WAIT_SECONDS = 30  # How long a set-lock request waits for an in-flight one before returning 409
+PDF_PROBE_CONCURRENCY = 4  # How many candidate PDF links are probed at once when mining an HTML page
+UPDATE_CHECK_CACHE_SECONDS = 60  # How long a fetched GitHub branch hash is reused before asking GitHub again
 
 # --- NEW: Define script's parent directory for robust pathing ---
 _SCRIPT_DIR = Path(__file__).resolve().parent
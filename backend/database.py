@@ -3,6 +3,7 @@ import json
 import os
 from pathlib import Path
 import time
+from functools import lru_cache
 
 # --- Configuration ---
 DATA_DIR = Path("data")
@@ -171,6 +172,22 @@ def index_dataset_if_needed(dataset_path: Path):
     print(f"     -> Ignored {duplicates} duplicate DOIs.")
     print(f"     -> Skipped {skipped_no_doi} lines with no DOI.")
 
+def get_paper_count(dataset_name: str) -> int:
+    """
+    Returns how many papers are indexed for a dataset. Cached until the index file changes,
+    so stats refreshes don't re-read the whole index just to count it.
+    """
+    db_path = get_db_path(dataset_name)
+    try:
+        db_mtime = db_path.stat().st_mtime
+    except OSError:
+        return 0
+    return _cached_index_rowcount(str(db_path), db_mtime)
+
+@lru_cache(maxsize=64)
+def _cached_index_rowcount(db_path: str, db_mtime: float) -> int:
+    return _index_rowcount(Path(db_path))
+
 def get_papers_index(dataset_name: str) -> list[dict]:
     """
     Retrieves the lightweight paper index from the SQLite database.
@@ -193,14 +210,37 @@ def get_papers_index(dataset_name: str) -> list[dict]:
         
     return papers
 
+class _PaperLineMiss(Exception):
+    """Raised by _read_paper_line for misses, so lru_cache never memoizes them."""
+
 def get_paper_by_doi_from_file(dataset_path: Path, doi: str) -> dict | None:
     """
     Retrieves the full JSON data for a single paper by its DOI using the byte offset.
+    The raw line is cached per (file, file mtime, index DB mtime, doi), so editing the dataset
+    or (re)building its index invalidates it. Only hits are cached: a paper that isn't
+    indexed yet is looked up again on the next call. A fresh dict is parsed on every call
+    so callers can mutate the result freely.
     """
+    try:
+        dataset_mtime = os.path.getmtime(dataset_path)
+        db_mtime = get_db_path(Path(dataset_path).name).stat().st_mtime
+    except OSError:
+        return None
+
+    try:
+        line = _read_paper_line(str(dataset_path), dataset_mtime, db_mtime, doi)
+    except _PaperLineMiss:
+        return None
+    return json.loads(line)
+
+@lru_cache(maxsize=256)
+def _read_paper_line(dataset_path: str, dataset_mtime: float, db_mtime: float, doi: str) -> bytes:
+    """Looks up a paper's byte offset and reads its raw JSON line. Raises _PaperLineMiss if it can't."""
+    dataset_path = Path(dataset_path)
     dataset_name = dataset_path.name
     db_path = get_db_path(dataset_name)
     if not db_path.exists():
-        return None
+        raise _PaperLineMiss(doi)
 
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
@@ -210,7 +250,7 @@ def get_paper_by_doi_from_file(dataset_path: Path, doi: str) -> dict | None:
     conn.close()
     
     if not result:
-        return None
+        raise _PaperLineMiss(doi)
         
     offset = result[0]
     
@@ -218,10 +258,11 @@ def get_paper_by_doi_from_file(dataset_path: Path, doi: str) -> dict | None:
         with open(dataset_path, 'rb') as f:
             f.seek(offset)
             line = f.readline()
-            return json.loads(line)
+            json.loads(line)  # Validate before caching
+            return line
     except (IOError, json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"ERROR: Could not retrieve paper '{doi}' from file at offset {offset}: {e}")
-        return None
+        raise _PaperLineMiss(doi)
 
 def search_papers_by_keyword(dataset_name: str, query: str) -> list[str]:
     """
@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv, find_dotenv
 import gspread
+from requests.adapters import HTTPAdapter
 
 # Import modular components
 from config import (
@@ -94,6 +95,12 @@ def run_startup_tasks():
             "https://www.googleapis.com/auth/drive.readonly"
         ]
         state.gspread_client = gspread.service_account(filename=CREDS_FILE, scopes=scopes)
+        # gspread keeps one authorized session for every call; widen its connection pool so
+        # sheet requests running concurrently in worker threads reuse keep-alive connections
+        # instead of opening (and then discarding) extra ones.
+        state.gspread_client.http_client.session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        )
         
         app.state.startup_message = "Discovering local datasets..."
         files_to_index = list(DATA_DIR.glob("*.jsonl"))
@@ -116,6 +123,12 @@ async def startup_event():
     loop = asyncio.get_event_loop()
     loop.run_in_executor(None, run_startup_tasks)
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Closes the pooled Google API connections."""
+    if state.gspread_client:
+        state.gspread_client.http_client.session.close()
+
 # --- Core Page and Status Endpoints ---
 
 @app.get("/", response_class=HTMLResponse)
@@ -1,4 +1,5 @@
 # backend/routers/ai.py
+import asyncio
 import json
 from fastapi import APIRouter, HTTPException
 
@@ -78,7 +79,7 @@ async def augment_data(request: AugmentationRequest):
 
         # 3. Get the spreadsheet and write the data
         spreadsheet = state.worksheet.spreadsheet
-        sheets.write_synthetic_data(spreadsheet, data_to_store)
+        await asyncio.to_thread(sheets.write_synthetic_data, spreadsheet, data_to_store)
         
         print(f"LOG: Successfully generated and stored {len(data_to_store)} synthetic records.")
         return {"status": "success", "message": f"Successfully augmented data with {len(data_to_store)} samples."}
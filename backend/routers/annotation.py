@@ -4,19 +4,16 @@ import json
 from typing import Optional
 from fastapi import APIRouter, HTTPException
 from gspread.exceptions import APIError
-from datetime import datetime
+from itertools import zip_longest
 
 from models import AnnotationSubmission, SkipRequest
 from app_state import state
 from config import LOCK_TIMEOUT_SECONDS
 from database import get_paper_by_doi_from_file
+from utils import fetch_data_columns, get_lock_timestamp, parse_lock_timestamp
 
 router = APIRouter()
 
-# --- FIX: Use a cross-platform compatible timestamp format ---
-def get_human_readable_timestamp():
-    return datetime.now().strftime('%m/%d/%Y - %I:%M:%S %p')
-
 def clear_lock(doi: str):
     """Finds a row by DOI and clears the lock_annotator and lock_timestamp fields."""
     print(f"LOG: Attempting to clear lock for DOI: {doi}")
@@ -38,6 +35,11 @@ def clear_lock(doi: str):
     except Exception as e:
         print(f"ERROR: Error clearing lock for DOI {doi}: {e}")
 
+def _read_columns(headers: list, names: list) -> list:
+    """Fetches only the named columns in one batch_get and returns the data rows as tuples, padded with ''."""
+    columns = fetch_data_columns(state.worksheet, [headers.index(name) + 1 for name in names])
+    return list(zip_longest(*columns, fillvalue=''))
+
 @router.get("/check-for-resumable-paper")
 def check_for_resumable_paper(annotator: str):
     print(f"LOG: Checking for resumable paper for annotator '{annotator}'")
@@ -45,34 +47,28 @@ def check_for_resumable_paper(annotator: str):
         return {"resumable": False}
 
     try:
-        all_values = state.worksheet.get_all_values()
-        if not all_values: return {"resumable": False}
+        headers = state.worksheet.row_values(1)
+        if not headers: return {"resumable": False}
         
-        headers = all_values[0]
         required_cols = ['doi', 'title', 'dataset', 'lock_annotator', 'lock_timestamp']
         if not all(h in headers for h in required_cols):
             return {"resumable": False}
 
-        doi_idx, title_idx, dataset_idx, lock_annotator_idx, lock_timestamp_idx = (headers.index(h) for h in required_cols)
-
-        for row in reversed(all_values[1:]):
-            if len(row) > max(lock_annotator_idx, lock_timestamp_idx, doi_idx, title_idx, dataset_idx):
-                if row[lock_annotator_idx].strip() == annotator and row[lock_timestamp_idx]:
-                    try:
-                        ts_str = row[lock_timestamp_idx]
-                        try:
-                            ts = datetime.strptime(ts_str, '%m/%d/%Y - %I:%M:%S %p').timestamp()
-                        except ValueError:
-                            ts = float(ts_str)
-
-                        if time.time() - ts < LOCK_TIMEOUT_SECONDS:
-                            print(f"LOG: Found resumable paper for {annotator}. DOI: {row[doi_idx]}")
-                            return {
-                                "resumable": True, "doi": row[doi_idx],
-                                "title": row[title_idx], "dataset": row[dataset_idx]
-                            }
-                    except (ValueError, TypeError):
-                        continue
+        # Only these five columns are needed, so fetch just them instead of the whole sheet.
+        for doi, title, dataset, lock_annotator, lock_timestamp in reversed(_read_columns(headers, required_cols)):
+            if lock_annotator.strip() == annotator and lock_timestamp:
+                try:
+                    ts = parse_lock_timestamp(lock_timestamp)
+                    if ts is None: continue
+
+                    if time.time() - ts < LOCK_TIMEOUT_SECONDS:
+                        print(f"LOG: Found resumable paper for {annotator}. DOI: {doi}")
+                        return {
+                            "resumable": True, "doi": doi,
+                            "title": title, "dataset": dataset
+                        }
+                except (ValueError, TypeError):
+                    continue
         
         return {"resumable": False}
     except Exception as e:
@@ -130,9 +126,8 @@ def get_next_paper(dataset: str, annotator: str, pdf_required: bool = True, skip
                 doi = row[doi_col_idx]
                 if doi and row[lock_annotator_col_idx].strip() != annotator and row[lock_timestamp_col_idx]:
                     try:
-                        ts_str = row[lock_timestamp_col_idx]
-                        try: ts = datetime.strptime(ts_str, '%m/%d/%Y - %I:%M:%S %p').timestamp()
-                        except ValueError: ts = float(ts_str)
+                        ts = parse_lock_timestamp(row[lock_timestamp_col_idx])
+                        if ts is None: continue
                         
                         if time.time() - ts < LOCK_TIMEOUT_SECONDS:
                             unavailable_dois.add(doi)
@@ -161,12 +156,12 @@ def get_next_paper(dataset: str, annotator: str, pdf_required: bool = True, skip
             cell = state.worksheet.find(candidate_doi, in_column=doi_col_idx + 1)
             if cell:
                 state.worksheet.update_cell(cell.row, lock_annotator_col_idx + 1, annotator)
-                state.worksheet.update_cell(cell.row, lock_timestamp_col_idx + 1, get_human_readable_timestamp())
+                state.worksheet.update_cell(cell.row, lock_timestamp_col_idx + 1, get_lock_timestamp())
             else:
                 placeholder_row = {h: "" for h in headers}
                 placeholder_row.update({
                     'doi': candidate_doi, 'title': full_candidate_paper.get('title', ''), 'dataset': dataset,
-                    'lock_annotator': annotator, 'lock_timestamp': get_human_readable_timestamp()
+                    'lock_annotator': annotator, 'lock_timestamp': get_lock_timestamp()
                 })
                 state.worksheet.append_row([placeholder_row.get(h, "") for h in headers], value_input_option='USER_ENTERED')
             
@@ -223,7 +218,12 @@ def submit_annotation(submission: AnnotationSubmission):
         
     submitted_doi = submission.doi
     try:
-        headers = state.worksheet.row_values(1)
+        # One full read serves both the header row and the DOI lookup below. A find() would
+        # download the whole sheet anyway, on top of a separate row_values(1) request.
+        all_values = state.worksheet.get_all_values()
+        headers = list(all_values[0]) if all_values else []
+        while headers and not headers[-1]:
+            headers.pop()  # get_all_values() pads the header row; row_values(1) did not
         if not headers:
             headers = list(submission.annotations.keys())
             base_headers = ['doi', 'title', 'dataset', 'annotator']
@@ -242,12 +242,13 @@ def submit_annotation(submission: AnnotationSubmission):
             state.worksheet.update('A1', [new_headers])
             headers = new_headers
 
-        cell = None
-        try:
-            doi_col_index = headers.index('doi') + 1
-            cell = state.worksheet.find(submitted_doi, in_column=doi_col_index)
-        except (ValueError, APIError):
-            cell = None
+        existing_row = None
+        if 'doi' in headers:
+            doi_idx = headers.index('doi')
+            existing_row = next(
+                (i for i, row in enumerate(all_values[1:], start=2) if doi_idx < len(row) and row[doi_idx] == submitted_doi),
+                None,
+            )
 
         def prepare_cell_value(raw_value):
             if raw_value is None:
@@ -266,12 +267,18 @@ def submit_annotation(submission: AnnotationSubmission):
             value = flat_submission.get(header, "")
             row_values.append(prepare_cell_value(value))
 
-        if cell:
-            state.worksheet.update(f'A{cell.row}', [row_values], value_input_option='USER_ENTERED')
+        # Release the lock in the same write instead of a clear_lock() pass, which would
+        # re-read the header row, search the sheet again and update each lock cell.
+        if 'lock_annotator' in headers and 'lock_timestamp' in headers:
+            row_values[headers.index('lock_annotator')] = ""
+            row_values[headers.index('lock_timestamp')] = ""
+
+        if existing_row:
+            state.worksheet.update(f'A{existing_row}', [row_values], value_input_option='USER_ENTERED')
         else:
             state.worksheet.append_row(row_values, value_input_option='USER_ENTERED')
 
-        clear_lock(submitted_doi)
+        state.STATS_VERSION += 1
 
         if submission.dataset in state.DATASET_QUEUES:
             state.DATASET_QUEUES[submission.dataset] = [p for p in state.DATASET_QUEUES[submission.dataset] if p.get('doi') != submitted_doi]
@@ -301,10 +308,8 @@ def get_lock_status(doi: str):
         lock_timestamp_str = state.worksheet.cell(cell.row, lock_ts_col_index).value
         if not lock_timestamp_str: return {"locked": False, "remaining_seconds": 0}
 
-        try:
-            ts = datetime.strptime(lock_timestamp_str, '%m/%d/%Y - %I:%M:%S %p').timestamp()
-        except ValueError:
-            ts = float(lock_timestamp_str)
+        ts = parse_lock_timestamp(lock_timestamp_str)
+        if ts is None: return {"locked": False, "remaining_seconds": 0}
 
         elapsed_time = time.time() - ts
         if elapsed_time < LOCK_TIMEOUT_SECONDS:
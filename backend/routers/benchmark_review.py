@@ -124,16 +124,26 @@ def _build_annotator_map_by_doi() -> Dict[str, str]:
     if not state.worksheet:
         return {}
     try:
-        rows = state.worksheet.get_all_records()
+        values = state.worksheet.get_all_values()
     except Exception:
         return {}
+    if not values:
+        return {}
+
+    # Only two columns are needed, so read them by position instead of building a
+    # numericised dict for every row with get_all_records().
+    headers = values[0]
+    doi_cols = [headers.index(name) for name in ("doi", "DOI") if name in headers]
+    annotator_cols = [headers.index(name) for name in ("annotator", "Annotator") if name in headers]
+    if not doi_cols or not annotator_cols:
+        return {}
 
     annotator_map: Dict[str, str] = {}
-    for row in rows or []:
-        doi = str(row.get("doi") or row.get("DOI") or "").strip()
+    for row in values[1:]:
+        doi = next((row[i] for i in doi_cols if row[i]), "").strip()
         if not doi or doi in annotator_map:
             continue
-        annotator = str(row.get("annotator") or row.get("Annotator") or "").strip()
+        annotator = next((row[i] for i in annotator_cols if row[i]), "").strip()
         if annotator:
             annotator_map[doi] = annotator
     return annotator_map
@@ -531,9 +541,15 @@ def _get_or_create_worksheet(
     missing = [h for h in ideal_headers if h not in existing_headers]
     if missing:
         try:
-            ws.add_cols(len(missing))
-            start_cell = gspread.utils.rowcol_to_a1(1, len(existing_headers) + 1)
-            ws.update(start_cell, [missing], value_input_option="USER_ENTERED")
+            # Grow the grid and write the new header cells in one (atomic) batchUpdate.
+            ss.batch_update({"requests": [
+                {"appendDimension": {"sheetId": ws.id, "dimension": "COLUMNS", "length": len(missing)}},
+                {"updateCells": {
+                    "start": {"sheetId": ws.id, "rowIndex": 0, "columnIndex": len(existing_headers)},
+                    "rows": [{"values": [{"userEnteredValue": {"stringValue": h}} for h in missing]}],
+                    "fields": "userEnteredValue",
+                }},
+            ]})
             existing_headers = existing_headers + missing
         except Exception:
             pass
@@ -1,17 +1,21 @@
 # backend/routers/dashboard.py
+import asyncio
 import time
 from collections import Counter
+from itertools import zip_longest
+from functools import lru_cache
 import json
 import math
 import gspread
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Optional
 from pydantic import BaseModel
 from app_state import state
 from models import ReopenRequest
-from database import get_papers_index, get_paper_by_doi_from_file
-from config import LOCK_TIMEOUT_SECONDS
-from datetime import datetime
+from database import get_paper_count, get_papers_index, get_paper_by_doi_from_file
+from config import LOCK_TIMEOUT_SECONDS, COMMENTS_CACHE_TTL_SECONDS, STATS_CACHE_TTL_SECONDS, SET_LOCK_WAIT_SECONDS
+from utils import fetch_data_columns, get_human_readable_timestamp, get_lock_timestamp, parse_lock_timestamp
 import re
 
 class SetLockRequest(BaseModel):
@@ -38,14 +42,24 @@ DEFAULT_CHECKLIST_CHOICES = [
 ]
 
 
+def _get_aux_worksheet(title: str):
+    """Resolves a worksheet of the connected spreadsheet by title, reusing the handle across
+    requests so each lookup doesn't cost a metadata fetch. Raises WorksheetNotFound like gspread."""
+    ss = state.spreadsheet
+    key = (ss.id, title)
+    worksheet = state.AUX_WORKSHEETS.get(key)
+    if worksheet is None:
+        worksheet = ss.worksheet(title)
+        state.AUX_WORKSHEETS[key] = worksheet
+    return worksheet
+
 def _get_reviews_worksheet():
     """Gets the 'Reviews' worksheet, returning None if it does not exist."""
     if not state.worksheet:
         print("WARN: Cannot get reviews worksheet, no main sheet connected.")
         return None
     try:
-        ss = state.worksheet.spreadsheet
-        return ss.worksheet("Reviews")
+        return _get_aux_worksheet("Reviews")
     except gspread.WorksheetNotFound:
         print("LOG: 'Reviews' worksheet not found, which is acceptable.")
         return None
@@ -59,16 +73,16 @@ def _get_comments_worksheet():
         print("WARN: Cannot get comments worksheet, no main sheet connected.")
         return None
     try:
-        ss = state.worksheet.spreadsheet
-        return ss.worksheet("Comments")
+        return _get_aux_worksheet("Comments")
     except gspread.WorksheetNotFound:
         print("LOG: 'Comments' worksheet not found. Creating it.")
         try:
-            ss = state.worksheet.spreadsheet
+            ss = state.spreadsheet
             comments_ws = ss.add_worksheet(title="Comments", rows="1", cols="4")
             # --- FIX: Set a more logical default header order ---
             comments_ws.update('A1', [['doi', 'annotator', 'timestamp', 'comment']])
             print("LOG: Successfully created 'Comments' worksheet with headers.")
+            state.AUX_WORKSHEETS[(ss.id, "Comments")] = comments_ws
             return comments_ws
         except Exception as create_e:
             print(f"ERROR: Failed to create 'Comments' worksheet: {create_e}")
@@ -77,10 +91,74 @@ def _get_comments_worksheet():
         print(f"ERROR: Could not get 'Comments' worksheet: {e}")
         return None
 
-router = APIRouter()
+def _comment_time(comment: dict) -> float:
+    """Sort key for comments. Their 'MM/DD/YYYY - ...' timestamps don't order correctly as strings
+    across years, so compare parsed epoch seconds; unparseable ones sort first."""
+    ts = parse_lock_timestamp(str(comment.get("timestamp", "")).strip())
+    return ts if ts is not None else float("-inf")
+
+# Comments grouped by DOI (each list sorted oldest-first), rebuilt from the
+# 'Comments' worksheet at most once per TTL instead of on every lookup.
+_COMMENTS_CACHE = {"spreadsheet_id": None, "fetched_at": 0.0, "by_doi": {}, "headers": []}
 
-def get_human_readable_timestamp():
-    return datetime.now().strftime('%m/%d/%Y - %I:%M:%S %p')
+
+def _get_comments_by_doi():
+    """Returns the cached DOI -> comments index, or None if the worksheet is unavailable."""
+    spreadsheet_id = state.spreadsheet.id if state.worksheet else None
+    if (
+        spreadsheet_id
+        and _COMMENTS_CACHE["spreadsheet_id"] == spreadsheet_id
+        and time.time() - _COMMENTS_CACHE["fetched_at"] < COMMENTS_CACHE_TTL_SECONDS
+    ):
+        return _COMMENTS_CACHE["by_doi"]
+
+    comments_ws = _get_comments_worksheet()
+    if not comments_ws:
+        return None
+
+    all_values = comments_ws.get_all_values()
+    by_doi = {}
+    for comment in _records_from_values(all_values):
+        by_doi.setdefault(comment.get("doi"), []).append(comment)
+    for comments in by_doi.values():
+        comments.sort(key=_comment_time)
+
+    # get_all_values pads rows to the sheet width; trim back to what row_values(1) returns.
+    headers = list(all_values[0]) if all_values else []
+    while headers and not headers[-1]:
+        headers.pop()
+    _COMMENTS_CACHE.update(spreadsheet_id=spreadsheet_id, fetched_at=time.time(), by_doi=by_doi, headers=headers)
+    return by_doi
+
+
+def _get_comments_headers(comments_ws):
+    """Returns the Comments header row, from the live comments index when there is one."""
+    if (
+        _COMMENTS_CACHE["headers"]
+        and _COMMENTS_CACHE["spreadsheet_id"] == state.spreadsheet.id
+        and time.time() - _COMMENTS_CACHE["fetched_at"] < COMMENTS_CACHE_TTL_SECONDS
+    ):
+        return _COMMENTS_CACHE["headers"]
+    return comments_ws.row_values(1)
+
+
+def _invalidate_comments_cache():
+    _COMMENTS_CACHE["fetched_at"] = 0.0
+
+
+def _add_to_comments_cache(headers, row):
+    """Writes a just-appended comment row through to the cached index, if the index is live."""
+    if not _COMMENTS_CACHE["fetched_at"] or _COMMENTS_CACHE["spreadsheet_id"] != state.spreadsheet.id:
+        return
+    comment = gspread.utils.to_records(headers, [gspread.utils.numericise_all(row)])[0]
+    # The new comment is stamped with the current time, so appending normally keeps the list
+    # oldest-first; re-sort only if the sheet already holds a later-stamped comment.
+    comments = _COMMENTS_CACHE["by_doi"].setdefault(comment.get("doi"), [])
+    comments.append(comment)
+    if len(comments) > 1 and _comment_time(comments[-2]) > _comment_time(comment):
+        comments.sort(key=_comment_time)
+
+router = APIRouter()
 
 def is_annotation_complete(record: dict) -> bool:
     """An annotation is considered complete if the 'annotator' field is filled."""
@@ -92,23 +170,93 @@ def _get_active_template():
     if not state.worksheet:
         return None
     try:
-        spreadsheet_id = state.worksheet.spreadsheet.id
+        spreadsheet_id = state.spreadsheet.id
     except Exception:
         return None
     return state.SHEET_TEMPLATES.get(spreadsheet_id)
 
 
-def _get_all_records():
-    """Helper to safely get all records from the connected worksheet."""
-    if not state.worksheet:
+def _first_row_matching(column_values, value) -> Optional[int]:
+    """Returns the 1-based sheet row of the first data cell equal to value, if any."""
+    for row_idx, cell_value in enumerate(column_values[1:], start=2):
+        if cell_value == value:
+            return row_idx
+    return None
+
+
+def _cell_in_column(column_values, row_idx: int) -> str:
+    """Reads a 1-based row from a column of sheet values, treating missing cells as ''."""
+    if row_idx - 1 < len(column_values):
+        return column_values[row_idx - 1] or ""
+    return ""
+
+
+def _lock_clear_ranges(rows, lock_annotator_col: int, lock_timestamp_col: int) -> list:
+    """Builds the A1 ranges that cover the lock columns for the given sheet rows, for `batch_clear`.
+
+    When the two lock columns sit side by side (the normal layout), runs of
+    consecutive rows collapse into a single rectangular range.
+    """
+    first_col, last_col = sorted((lock_annotator_col, lock_timestamp_col))
+    if last_col - first_col != 1:
+        return [
+            gspread.utils.rowcol_to_a1(row, col)
+            for row in rows
+            for col in (first_col, last_col)
+        ]
+
+    runs = []
+    for row in sorted(set(rows)):
+        if runs and row == runs[-1][1] + 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return [
+        f"{gspread.utils.rowcol_to_a1(start_row, first_col)}:{gspread.utils.rowcol_to_a1(end_row, last_col)}"
+        for start_row, end_row in runs
+    ]
+
+
+def _get_all_records(worksheet=None):
+    """Helper to safely get all records from a worksheet (the connected one by default)."""
+    worksheet = worksheet or state.worksheet
+    if not worksheet:
         print("WARN: Attempted to get records but no worksheet is connected.")
         return []
     try:
-        return state.worksheet.get_all_records()
+        return _records_from_values(worksheet.get_all_values())
     except Exception as e:
         print(f"ERROR: Could not fetch records from Google Sheet: {e}")
         return []
 
+def _check_unique_headers(headers):
+    """Rejects duplicate header names the same way `get_all_records()` does."""
+    duplicates = [header for header, count in Counter(headers).items() if count > 1]
+    if duplicates:
+        raise gspread.exceptions.GSpreadException(
+            f"the header row in the worksheet contains duplicates: {duplicates}"
+        )
+
+def _records_from_values(all_values):
+    """Builds the same dicts as `get_all_records()` from an already-fetched `get_all_values()` grid."""
+    if not all_values or all_values == [[]]:
+        return []
+    headers = all_values[0]
+    _check_unique_headers(headers)
+    return gspread.utils.to_records(headers, (gspread.utils.numericise_all(row) for row in all_values[1:]))
+
+def _batch_get_all_values(*worksheets):
+    """Reads several worksheets of the connected spreadsheet in one values.batchGet call.
+
+    Returns one grid per worksheet, padded the same way as `get_all_values()`.
+    """
+    ranges = [gspread.utils.absolute_range_name(ws.title) for ws in worksheets]
+    response = state.spreadsheet.values_batch_get(ranges)
+    return [
+        gspread.utils.fill_gaps(value_range["values"]) if value_range.get("values") else []
+        for value_range in response.get("valueRanges", [])
+    ]
+
 _KNOWN_METADATA_FIELDS = {
     "annotator",
     "doi",
@@ -146,25 +294,21 @@ def _has_meaningful_value(value) -> bool:
     if value is None:
         return False
     if isinstance(value, str):
-        return value.strip() != ""
+        # isspace() is False for "", so check truthiness first; neither allocates a stripped copy.
+        return bool(value) and not value.isspace()
     if isinstance(value, (list, tuple, set, dict)):
         return len(value) > 0
     return True
 
 
-def _record_has_submission(record: dict) -> bool:
-    annotator_value = record.get("annotator")
-    if _has_meaningful_value(annotator_value):
-        return True
-    annotator_value = record.get("Annotator")
-    return _has_meaningful_value(annotator_value)
+_TEMPLATE_FIELDS_CACHE = {}
 
 
 def _get_template_annotation_fields(headers):
     if not state.worksheet:
         return []
     try:
-        spreadsheet_id = state.worksheet.spreadsheet.id
+        spreadsheet_id = state.spreadsheet.id
     except Exception:
         return []
 
@@ -172,6 +316,13 @@ def _get_template_annotation_fields(headers):
     if not template:
         return []
 
+    # Templates are replaced (never mutated) when reloaded, so holding on to the
+    # template object and checking identity invalidates the entry by itself.
+    cache_key = (spreadsheet_id, tuple(headers))
+    cached = _TEMPLATE_FIELDS_CACHE.get(cache_key)
+    if cached and cached[0] is template:
+        return list(cached[1])
+
     header_set = set(headers)
     fields = []
     for field in template.get("fields", []):
@@ -180,10 +331,16 @@ def _get_template_annotation_fields(headers):
             continue
         if field_id in header_set:
             fields.append(field_id)
+
+    if len(_TEMPLATE_FIELDS_CACHE) >= 128:
+        _TEMPLATE_FIELDS_CACHE.clear()
+    _TEMPLATE_FIELDS_CACHE[cache_key] = (template, tuple(fields))
     return fields
 
 
-def _infer_annotation_fields(headers):
+@lru_cache(maxsize=32)
+def _infer_annotation_fields(headers: tuple) -> tuple:
+    """Picks the headers that look like annotation fields. Cached per header row, which rarely changes."""
     inferred = []
     for header in headers:
         if not header:
@@ -193,12 +350,10 @@ def _infer_annotation_fields(headers):
             continue
         if normalized in _KNOWN_METADATA_FIELDS:
             continue
-        if any(normalized.startswith(prefix) for prefix in _METADATA_PREFIXES):
-            continue
-        if any(normalized.endswith(suffix) for suffix in _METADATA_SUFFIXES):
+        if normalized.startswith(_METADATA_PREFIXES) or normalized.endswith(_METADATA_SUFFIXES):
             continue
         inferred.append(header)
-    return inferred
+    return tuple(inferred)
 
 
 def _resolve_annotation_fields(headers):
@@ -207,13 +362,23 @@ def _resolve_annotation_fields(headers):
     from_template = _get_template_annotation_fields(headers)
     if from_template:
         return from_template
-    return _infer_annotation_fields(headers)
+    return list(_infer_annotation_fields(tuple(headers)))
+
+
+# Common spellings of sheet booleans, mapped without allocating a stripped/uppercased copy.
+_BOOL_STRINGS = {
+    "TRUE": "TRUE", "True": "TRUE", "true": "TRUE",
+    "FALSE": "FALSE", "False": "FALSE", "false": "FALSE",
+}
 
 
 def _normalize_bool_value(value):
     if isinstance(value, bool):
         return "TRUE" if value else "FALSE"
     if isinstance(value, str):
+        canonical = _BOOL_STRINGS.get(value)
+        if canonical:
+            return canonical
         upper = value.strip().upper()
         if upper in ("TRUE", "FALSE"):
             return upper
@@ -252,15 +417,18 @@ def _normalize_choice_map(choices):
     return mapping
 
 
-def _is_record_complete(record, annotation_fields):
-    if not annotation_fields:
-        return True
-    for field in annotation_fields:
-        value = record.get(field)
-        if _has_meaningful_value(value):
-            continue
-        return False
-    return True
+def _count_values(values, normalizer=None):
+    """Tally a column of cell values, normalizing each distinct value only once.
+
+    Counter does the per-row counting in C; normalization (and dropping empty
+    values) then runs once per distinct raw value instead of once per row.
+    """
+    counts = Counter()
+    for raw_value, occurrences in Counter(values).items():
+        value = normalizer(raw_value) if normalizer else raw_value
+        if value:
+            counts[value] += occurrences
+    return counts
 
 
 def _coerce_number(value):
@@ -511,8 +679,12 @@ def _calculate_annotation_completeness(records):
             "incomplete": 0,
             "fields": [],
             "annotated_records": [],
+            "completed_records": [],
             "incomplete_details": [],
             "dataset_annotation_counts": Counter(),
+            "doc_type_counts": Counter(),
+            "annotator_counts": Counter(),
+            "dataset_counts": Counter(),
         }
 
     headers = list(records[0].keys())
@@ -522,42 +694,61 @@ def _calculate_annotation_completeness(records):
     completed = 0
     incomplete = 0
     annotated_records = []
+    completed_records = []
     incomplete_details = []
     dataset_annotation_counts = Counter()
+    # Distributions for the detailed stats view, tallied in the same pass.
+    doc_type_counts = Counter()
+    annotator_counts = Counter()
+    dataset_counts = Counter()
+    default_dataset = getattr(state, "currentDataset", "")
 
     for record in records:
-        if not _record_has_submission(record):
+        # Each column is looked up once per record; the lower/upper-case variants are
+        # combined below in the same precedence the separate lookups used.
+        annotator_lower = record.get("annotator")
+        annotator_upper = record.get("Annotator")
+        if not (_has_meaningful_value(annotator_lower) or _has_meaningful_value(annotator_upper)):
             continue
         annotated_records.append(record)
         total += 1
 
-        dataset_value = (
-            record.get("dataset")
-            or record.get("Dataset")
-            or getattr(state, "currentDataset", "")
-        )
+        dataset_lower = record.get("dataset")
+        dataset_upper = record.get("Dataset")
+        dataset_value = dataset_lower or dataset_upper or default_dataset
         if dataset_value:
             dataset_annotation_counts[dataset_value] += 1
 
+        doc_type = record.get("attribute_docType")
+        if doc_type:
+            doc_type_counts[doc_type] += 1
+        annotator_name = annotator_upper or annotator_lower
+        if annotator_name:
+            annotator_counts[annotator_name] += 1
+        dataset_name = dataset_upper or dataset_lower or default_dataset
+        if dataset_name:
+            dataset_counts[dataset_name] += 1
+
         if not annotation_fields:
             completed += 1
+            completed_records.append(record)
             continue
 
-        missing_fields = []
-        for field in annotation_fields:
-            value = record.get(field)
-            if _has_meaningful_value(value):
-                continue
-            missing_fields.append(field)
-
-        if not missing_fields:
+        # Most submitted records are complete, so stop at the first gap and only
+        # collect the full list of missing fields for the incomplete ones.
+        if all(_has_meaningful_value(record.get(field)) for field in annotation_fields):
             completed += 1
+            completed_records.append(record)
         else:
+            missing_fields = [
+                field for field in annotation_fields
+                if not _has_meaningful_value(record.get(field))
+            ]
             incomplete += 1
             incomplete_details.append({
                 "doi": record.get("doi") or record.get("DOI") or "",
                 "title": record.get("title") or record.get("Title") or "",
-                "annotator": record.get("annotator") or record.get("Annotator") or "",
+                "annotator": annotator_lower or annotator_upper or "",
                 "dataset": dataset_value,
                 "missing_fields": missing_fields,
             })
@@ -568,8 +759,12 @@ def _calculate_annotation_completeness(records):
         "incomplete": incomplete,
         "fields": annotation_fields,
         "annotated_records": annotated_records,
+        "completed_records": completed_records,
         "incomplete_details": incomplete_details,
         "dataset_annotation_counts": dataset_annotation_counts,
+        "doc_type_counts": doc_type_counts,
+        "annotator_counts": annotator_counts,
+        "dataset_counts": dataset_counts,
     }
 
 
@@ -587,7 +782,7 @@ def _calculate_remaining_articles(dataset_annotation_counts: Counter):
         if not dataset_name:
             continue
         try:
-            total_papers = len(get_papers_index(dataset_name))
+            total_papers = get_paper_count(dataset_name)
         except Exception as e:
             print(f"WARN: Could not determine total papers for dataset '{dataset_name}': {e}")
             total_papers = 0
@@ -611,7 +806,7 @@ async def get_synthetic_sheet_data():
         raise HTTPException(status_code=400, detail="No active Google Sheet connection.")
     
     try:
-        spreadsheet = state.worksheet.spreadsheet
+        spreadsheet = state.spreadsheet
         synth_worksheet = spreadsheet.worksheet("SyntheticData")
         
         all_values = synth_worksheet.get_all_values()
@@ -631,20 +826,14 @@ async def get_synthetic_sheet_data():
 
 @router.get("/api/comments/{doi:path}")
 async def get_comments(doi: str):
-    comments_ws = _get_comments_worksheet()
-    if not comments_ws:
-        raise HTTPException(status_code=500, detail="Could not access the Comments worksheet.")
-    
     try:
-        all_comments = comments_ws.get_all_records()
-        doi_comments = [
-            comment for comment in all_comments 
-            if comment.get('doi') == doi
-        ]
-        doi_comments.sort(key=lambda r: r.get("timestamp", ""))
-        return {"items": doi_comments}
+        comments_by_doi = _get_comments_by_doi()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve comments: {e}")
+    if comments_by_doi is None:
+        raise HTTPException(status_code=500, detail="Could not access the Comments worksheet.")
+
+    return {"items": list(comments_by_doi.get(doi, []))}
 
 @router.post("/api/comments")
 async def add_comment(request: CommentRequest):
@@ -654,7 +843,7 @@ async def add_comment(request: CommentRequest):
 
     try:
         # --- FIX: Read headers to ensure data is inserted into the correct columns ---
-        headers = comments_ws.row_values(1)
+        headers = _get_comments_headers(comments_ws)
         if not headers:
              raise HTTPException(status_code=500, detail="Comments worksheet is missing headers.")
 
@@ -668,55 +857,122 @@ async def add_comment(request: CommentRequest):
         # Build the row in the exact order of the sheet's current headers
         new_row = [comment_data.get(header, "") for header in headers]
         
-        comments_ws.append_row(new_row, value_input_option='USER_ENTERED')
+        await _append_comment_row(comments_ws, headers, new_row)
         return {"status": "success", "message": "Comment added."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to post comment: {e}")
 
 
+# Comment rows waiting to be written, as (worksheet, headers, row, future). Whoever holds
+# _COMMENTS_APPEND_GUARD writes every row queued for its worksheet in one append_rows call,
+# so comments posted while an append is in flight share the next request instead of each
+# costing their own. Every caller still waits for its own row to be written.
+_PENDING_COMMENT_ROWS = []
+_COMMENTS_APPEND_GUARD = asyncio.Lock()
+
+async def _append_comment_row(comments_ws, headers, row):
+    future = asyncio.get_running_loop().create_future()
+    _PENDING_COMMENT_ROWS.append((comments_ws, headers, row, future))
+    try:
+        async with _COMMENTS_APPEND_GUARD:
+            if not future.done():
+                # Posts whose caller went away before their turn (cancelled futures) are dropped.
+                batch = [entry for entry in _PENDING_COMMENT_ROWS if entry[0] is comments_ws and not entry[3].done()]
+                _PENDING_COMMENT_ROWS[:] = [entry for entry in _PENDING_COMMENT_ROWS if entry[0] is not comments_ws]
+                if batch:
+                    write = asyncio.ensure_future(asyncio.to_thread(
+                        comments_ws.append_rows, [entry[2] for entry in batch], value_input_option='USER_ENTERED'
+                    ))
+                    # The callback resolves every entry once the write finishes, even if this caller
+                    # is cancelled meanwhile; asyncio.wait neither raises nor cancels the write.
+                    write.add_done_callback(lambda task: _finish_comment_batch(batch, task))
+                    await asyncio.wait([write])
+        await future
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+
+def _finish_comment_batch(batch, write):
+    error = asyncio.CancelledError() if write.cancelled() else write.exception()
+    try:
+        if error is None:
+            if len(batch) > 1:
+                print(f"LOG: Appended {len(batch)} queued comments in one request.")
+            try:
+                for _, entry_headers, entry_row, _ in batch:
+                    _add_to_comments_cache(entry_headers, entry_row)
+            except Exception as e:
+                print(f"WARN: Could not add posted comments to the cache, dropping it: {e}")
+                _invalidate_comments_cache()
+    finally:
+        for _, _, _, entry_future in batch:
+            if entry_future.done():
+                continue
+            if error is None:
+                entry_future.set_result(None)
+            elif isinstance(error, asyncio.CancelledError):
+                entry_future.cancel()
+            else:
+                entry_future.set_exception(error)
+
+
+# Serializes set-lock writes. A per-DOI lock is not enough here: moving a lock can
+# delete the annotator's old placeholder row, which renumbers every row below it.
+# Holding this lock while the Sheets calls run in a worker thread keeps writes
+# ordered without blocking the event loop for other requests.
+_SET_LOCK_GUARD = asyncio.Lock()
+
 @router.post("/api/set-lock")
 async def set_lock(request: SetLockRequest):
     if not state.worksheet:
         raise HTTPException(status_code=400, detail="No active Google Sheet connection.")
 
     try:
-        headers = state.worksheet.row_values(1)
+        await asyncio.wait_for(_SET_LOCK_GUARD.acquire(), timeout=SET_LOCK_WAIT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=409, detail="Another lock update is still in progress. Please try again.")
+    try:
+        return await asyncio.to_thread(_set_lock_sync, request)
+    finally:
+        _SET_LOCK_GUARD.release()
+
+
+def _set_lock_sync(request: SetLockRequest):
+    try:
+        # One read of the whole grid replaces separate header/column fetches and
+        # server-side `find` scans; row lookups are then done locally.
+        all_values = state.worksheet.get_all_values()
+        headers = all_values[0] if all_values else []
         doi_col = headers.index('doi') + 1
         annotator_col = headers.index('annotator') + 1
         lock_annotator_col = headers.index('lock_annotator') + 1
         lock_timestamp_col = headers.index('lock_timestamp') + 1
 
-        old_lock_cell = None
-        try:
-            old_lock_cell = state.worksheet.find(request.annotator, in_column=lock_annotator_col)
-        except gspread.exceptions.CellNotFound:
-            pass 
+        columns = list(zip(*all_values))
+        doi_values = columns[doi_col - 1]
+        annotator_values = columns[annotator_col - 1]
+        lock_annotator_values = columns[lock_annotator_col - 1]
 
-        new_lock_target_cell = None
-        try:
-            new_lock_target_cell = state.worksheet.find(request.doi, in_column=doi_col)
-        except gspread.exceptions.CellNotFound:
-            pass
+        old_lock_row_idx = _first_row_matching(lock_annotator_values, request.annotator)
+        new_lock_target_row = _first_row_matching(doi_values, request.doi)
 
-        if old_lock_cell:
-            old_lock_row_idx = old_lock_cell.row
-            main_annotator_val = state.worksheet.cell(old_lock_row_idx, annotator_col).value
-            is_placeholder = not main_annotator_val or not main_annotator_val.strip()
+        if old_lock_row_idx:
+            main_annotator_val = _cell_in_column(annotator_values, old_lock_row_idx)
+            is_placeholder = not main_annotator_val.strip()
 
             if is_placeholder:
                 state.worksheet.delete_rows(old_lock_row_idx)
-                if new_lock_target_cell and new_lock_target_cell.row > old_lock_row_idx:
-                    new_lock_target_cell = gspread.Cell(row=new_lock_target_cell.row - 1, col=new_lock_target_cell.col)
+                if new_lock_target_row and new_lock_target_row > old_lock_row_idx:
+                    new_lock_target_row -= 1
             else:
-                state.worksheet.batch_update([
-                    {'range': gspread.utils.rowcol_to_a1(old_lock_row_idx, lock_annotator_col), 'values': [['']]},
-                    {'range': gspread.utils.rowcol_to_a1(old_lock_row_idx, lock_timestamp_col), 'values': [['']]}
-                ])
+                state.worksheet.batch_clear(
+                    _lock_clear_ranges([old_lock_row_idx], lock_annotator_col, lock_timestamp_col)
+                )
 
-        if new_lock_target_cell:
+        if new_lock_target_row:
             state.worksheet.batch_update([
-                {'range': gspread.utils.rowcol_to_a1(new_lock_target_cell.row, lock_annotator_col), 'values': [[request.annotator]]},
-                {'range': gspread.utils.rowcol_to_a1(new_lock_target_cell.row, lock_timestamp_col), 'values': [[get_human_readable_timestamp()]]}
+                {'range': gspread.utils.rowcol_to_a1(new_lock_target_row, lock_annotator_col), 'values': [[request.annotator]]},
+                {'range': gspread.utils.rowcol_to_a1(new_lock_target_row, lock_timestamp_col), 'values': [[get_lock_timestamp()]]}
             ], value_input_option='USER_ENTERED')
         else:
             paper_info = get_paper_by_doi_from_file(state.AVAILABLE_DATASETS[request.dataset], request.doi)
@@ -728,7 +984,7 @@ async def set_lock(request: SetLockRequest):
             row_values[headers.index('title')] = paper_info.get('title', 'Title not found')
             row_values[headers.index('dataset')] = request.dataset
             row_values[headers.index('lock_annotator')] = request.annotator
-            row_values[headers.index('lock_timestamp')] = get_human_readable_timestamp()
+            row_values[headers.index('lock_timestamp')] = get_lock_timestamp()
             
             state.worksheet.append_row(row_values, value_input_option='USER_ENTERED')
 
@@ -738,6 +994,8 @@ async def set_lock(request: SetLockRequest):
         raise HTTPException(status_code=500, detail=f"Failed to set lock in Google Sheet: {e}")
 
 
+_SHEET_DATA_INFLIGHT = {}
+
 @router.get("/api/sheet-data")
 async def get_sheet_data(dataset: Optional[str] = None):
     if not state.worksheet:
@@ -747,84 +1005,121 @@ async def get_sheet_data(dataset: Optional[str] = None):
     if not active_dataset_name:
          return {"headers": [], "rows": []}
 
+    # Singleflight: concurrent refreshes for the same dataset share one in-flight build.
+    task = _SHEET_DATA_INFLIGHT.get(active_dataset_name)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(_build_sheet_data, active_dataset_name))
+        _SHEET_DATA_INFLIGHT[active_dataset_name] = task
+        task.add_done_callback(lambda _: _SHEET_DATA_INFLIGHT.pop(active_dataset_name, None))
+    # Shielded so one client disconnecting doesn't cancel the build for everyone else.
+    payload = await asyncio.shield(task)
+    # Every value is already a plain str/int/float from gspread, so skip FastAPI's
+    # recursive jsonable_encoder walk over what is usually the largest payload we serve.
+    return JSONResponse(content=payload)
+
+
+def _build_sheet_data(active_dataset_name: str):
     try:
-        all_values = state.worksheet.get_all_values()
-        headers = all_values[0] if all_values else []
+        # One batched read serves the stale-lock scan, the row records and the comments.
+        comments_ws = _get_comments_worksheet()
+        if comments_ws:
+            all_values, comment_values = _batch_get_all_values(state.worksheet, comments_ws)
+        else:
+            all_values, comment_values = state.worksheet.get_all_values(), []
+        headers = list(all_values[0]) if all_values else []
         
+        current_time = time.time()
+        # Parsed lock time per data row, reused by the status computation below.
+        lock_ts_by_row = [None] * max(len(all_values) - 1, 0)
         lock_timestamp_col = headers.index('lock_timestamp') + 1 if 'lock_timestamp' in headers else -1
         if lock_timestamp_col != -1:
-            cells_to_clear = []
-            current_time = time.time()
+            stale_rows = []
             for i, row in enumerate(all_values[1:], start=2):
                 if len(row) >= lock_timestamp_col:
-                    ts_str = row[lock_timestamp_col - 1]
+                    ts_str = row[lock_timestamp_col - 1].strip()
                     if not ts_str: continue
-                    try:
-                        ts = datetime.strptime(ts_str, '%m/%d/%Y - %I:%M:%S %p').timestamp()
-                    except ValueError:
-                        try: ts = float(ts_str)
-                        except ValueError: continue
+                    ts = parse_lock_timestamp(ts_str)
+                    if ts is None: continue
+                    lock_ts_by_row[i - 2] = ts
                     
                     if current_time - ts > LOCK_TIMEOUT_SECONDS:
                         print(f"LOG: Found stale lock on row {i}. Clearing.")
-                        cells_to_clear.append(gspread.Cell(row=i, col=headers.index('lock_annotator') + 1, value=""))
-                        cells_to_clear.append(gspread.Cell(row=i, col=lock_timestamp_col, value=""))
+                        stale_rows.append(i)
             
-            if cells_to_clear:
-                state.worksheet.update_cells(cells_to_clear, value_input_option='USER_ENTERED')
+            if stale_rows:
+                lock_annotator_col = headers.index('lock_annotator') + 1
+                state.worksheet.batch_clear(
+                    _lock_clear_ranges(stale_rows, lock_annotator_col, lock_timestamp_col)
+                )
+                # Mirror the cleared cells locally instead of re-reading the sheet.
+                for i in stale_rows:
+                    row = all_values[i - 1]
+                    row[lock_annotator_col - 1] = ''
+                    row[lock_timestamp_col - 1] = ''
         
-        sheet_records = state.worksheet.get_all_records()
+        # Rows are read by column index rather than turned into per-row record dicts;
+        # the only dict built per row is the one sent to the client.
+        _check_unique_headers(headers)
+        column_index = {header: i for i, header in enumerate(headers)}
+        doi_idx, title_idx, annotator_idx, lock_annotator_idx = (
+            column_index.get(key) for key in ('doi', 'title', 'annotator', 'lock_annotator')
+        )
 
-        sheet_dois = {record.get('doi') for record in sheet_records}
         all_papers_index = get_papers_index(active_dataset_name)
 
         latest_comments = {}
-        comments_ws = _get_comments_worksheet()
         if comments_ws:
-            all_comments = comments_ws.get_all_records()
-            all_comments.sort(key=lambda r: r.get("timestamp", ""), reverse=True)
-            for comment in all_comments:
+            # Single pass keeping the newest comment per DOI (ties go to the earliest row).
+            latest_by_doi = {}
+            for comment in _records_from_values(comment_values):
                 doi = comment.get("doi")
-                if doi and doi not in latest_comments:
-                    latest_comments[doi] = f"{comment.get('annotator', 'Anon')}: {comment.get('comment', '')}"
+                if not doi: continue
+                ts = _comment_time(comment)
+                if doi not in latest_by_doi or ts > latest_by_doi[doi][0]:
+                    latest_by_doi[doi] = (ts, comment)
+            for doi, (_, comment) in latest_by_doi.items():
+                latest_comments[doi] = f"{comment.get('annotator', 'Anon')}: {comment.get('comment', '')}"
         
         if "Latest Comment" not in headers: headers.append("Latest Comment")
-
+        # Normalize each header once rather than once per record; the first header
+        # that maps to a given key wins, and the fixed keys are never overwritten.
+        extra_columns = []
+        seen_keys = {'doi', 'title', 'annotator', 'status', 'latest_comment'}
+        for header in headers:
+            field_key = header.replace(' ', '_').lower()
+            if field_key in seen_keys: continue
+            seen_keys.add(field_key)
+            extra_columns.append((field_key, column_index.get(header)))
+
+        sheet_dois = set()
         processed_rows = []
-        for record in sheet_records:
-            doi = record.get('doi')
+        for values, lock_ts in zip(all_values[1:], lock_ts_by_row):
+            # Rows without a DOI are dropped below anyway, so skip them before numericising.
+            if doi_idx is None or not values[doi_idx]: continue
+            values = gspread.utils.numericise_all(values)
+            doi = values[doi_idx] if doi_idx is not None else None
             if not doi: continue
+            sheet_dois.add(doi)
             
-            is_complete = is_annotation_complete(record)
-            annotator = record.get('annotator', '')
+            annotator = values[annotator_idx] if annotator_idx is not None else ''
+            is_complete = bool(annotator.strip())
             status = 'Incomplete'
 
-            lock_ts_str = str(record.get('lock_timestamp', '')).strip()
-            is_locked = False
-            if lock_ts_str:
-                try:
-                    ts = datetime.strptime(lock_ts_str, '%m/%d/%Y - %I:%M:%S %p').timestamp()
-                except ValueError:
-                    try: ts = float(lock_ts_str)
-                    except ValueError: ts = 0
-                if time.time() - ts < LOCK_TIMEOUT_SECONDS:
-                    is_locked = True
+            is_locked = lock_ts is not None and current_time - lock_ts < LOCK_TIMEOUT_SECONDS
 
             if is_locked:
-                annotator = record.get('lock_annotator', '')
+                annotator = values[lock_annotator_idx] if lock_annotator_idx is not None else ''
                 status = 'Reviewing' if is_complete else 'Locked'
             elif is_complete:
                 status = 'Completed'
 
             row = {
-                'doi': doi, 'title': record.get('title', 'No Title'),
+                'doi': doi, 'title': values[title_idx] if title_idx is not None else 'No Title',
                 'annotator': annotator, 'status': status,
                 'latest_comment': latest_comments.get(doi, '')
             }
-            for header in headers:
-                field_key = header.replace(' ', '_').lower()
-                if field_key not in row:
-                    row[field_key] = record.get(header, '')
+            for field_key, i in extra_columns:
+                row[field_key] = values[i] if i is not None else ''
             processed_rows.append(row)
 
         for paper in all_papers_index:
@@ -871,26 +1166,93 @@ async def reopen_annotation(request: ReopenRequest):
     
     return paper
 
-@router.get("/get-sheet-stats")
-async def get_sheet_stats():
-    """Provides simple counts of completed vs incomplete annotations."""
+# Both stats payloads are derived from one full-sheet read. They are served from
+# here for STATS_CACHE_TTL_SECONDS and then refreshed in the background while the
+# previous payload keeps being returned (stale-while-revalidate).
+# A rebuild after an invalidation (e.g. a submitted annotation) is shared by every request
+# that arrives while it runs; the dashboard asks for both payloads at once.
+_STATS_CACHE = {"key": None, "fetched_at": 0.0, "simple": None, "detailed": None, "refresh_task": None, "refresh_key": None}
+
+
+def _stats_cache_key():
+    return (
+        state.spreadsheet.id,
+        state.worksheet.id,
+        getattr(state, "currentDataset", None),
+        state.STATS_VERSION,
+    )
+
+
+def _compute_stats():
+    """Reads the sheet once and builds both the simple and the detailed stats payloads."""
     records = _get_all_records()
-    stats = _calculate_annotation_completeness(records)
-    remaining_info = _calculate_remaining_articles(stats["dataset_annotation_counts"])
-    return {
-        "total_count": stats["total"],
-        "completed_count": stats["completed"],
-        "incomplete_count": stats["incomplete"],
+    completeness = _calculate_annotation_completeness(records)
+    remaining_info = _calculate_remaining_articles(completeness["dataset_annotation_counts"])
+    simple = {
+        "total_count": completeness["total"],
+        "completed_count": completeness["completed"],
+        "incomplete_count": completeness["incomplete"],
         "remaining_count": remaining_info["total_remaining"],
     }
+    return simple, _build_detailed_stats(completeness, remaining_info)
+
+
+async def _refresh_stats(key):
+    simple, detailed = await asyncio.to_thread(_compute_stats)
+    _STATS_CACHE.update(key=key, fetched_at=time.time(), simple=simple, detailed=detailed)
+
+
+async def _refresh_stats_in_background(key):
+    try:
+        await _refresh_stats(key)
+    except Exception as e:
+        print(f"ERROR: Background stats refresh failed: {e}")
+
+
+async def _get_stats():
+    """Returns (simple, detailed) stats, computing them off the event loop on a cold or invalidated cache."""
+    if not state.worksheet:
+        return await asyncio.to_thread(_compute_stats)
+
+    key = _stats_cache_key()
+    if _STATS_CACHE["key"] == key and _STATS_CACHE["detailed"] is not None:
+        if time.time() - _STATS_CACHE["fetched_at"] >= STATS_CACHE_TTL_SECONDS:
+            task = _STATS_CACHE["refresh_task"]
+            if task is None or task.done():
+                _STATS_CACHE.update(refresh_task=asyncio.create_task(_refresh_stats_in_background(key)), refresh_key=key)
+        return _STATS_CACHE["simple"], _STATS_CACHE["detailed"]
+
+    task = _STATS_CACHE["refresh_task"]
+    if task is None or task.done() or _STATS_CACHE["refresh_key"] != key:
+        task = asyncio.ensure_future(_refresh_stats(key))
+        _STATS_CACHE.update(refresh_task=task, refresh_key=key)
+    # Shielded so one client disconnecting doesn't cancel the rebuild for the others.
+    await asyncio.shield(task)
+    return _STATS_CACHE["simple"], _STATS_CACHE["detailed"]
+
+
+@router.get("/get-sheet-stats")
+async def get_sheet_stats():
+    """Provides simple counts of completed vs incomplete annotations."""
+    simple, _ = await _get_stats()
+    return simple
 
 @router.get("/get-detailed-stats")
 async def get_detailed_stats():
-    records = _get_all_records()
-    completeness = _calculate_annotation_completeness(records)
+    _, detailed = await _get_stats()
+    return detailed
+
+@router.post("/api/refresh-cache")
+async def refresh_cache():
+    """Drops the cached stats and comments, e.g. after the sheet was edited directly in Google Sheets."""
+    state.STATS_VERSION += 1
+    _invalidate_comments_cache()
+    return {"status": "success", "message": "Cached sheet data cleared."}
+
+
+def _build_detailed_stats(completeness, remaining_info):
     annotated_records = completeness["annotated_records"]
     total_annotations = completeness["total"]
-    remaining_info = _calculate_remaining_articles(completeness["dataset_annotation_counts"])
 
     if not annotated_records:
         return {
@@ -911,23 +1273,26 @@ async def get_detailed_stats():
 
     overall_counts = {}
     field_breakdowns = []
-    doc_type_counts = Counter()
-    annotator_counts = Counter()
-    dataset_counts = Counter()
 
-    headers = list(annotated_records[0].keys()) if annotated_records else (list(records[0].keys()) if records else [])
+    headers = list(annotated_records[0].keys())
+    # Every record is keyed by the same header row (see _records_from_values), so one zip
+    # transposes them into per-field columns instead of a dict lookup per record per field.
+    columns = dict(zip(headers, zip(*[record.values() for record in annotated_records])))
+    missing_column = (None,) * len(annotated_records)
     template = _get_active_template()
     template_fields = []
+    template_order = {}
+    template_by_id = {}
     header_set = set(headers)
 
     if template:
         for field in template.get("fields", []):
             field_id = field.get("id")
             if field_id and field_id in header_set:
+                template_order[field_id] = len(template_fields)
+                template_by_id.setdefault(field_id, field)
                 template_fields.append(field)
 
-    template_order = {field.get("id"): idx for idx, field in enumerate(template_fields) if field.get("id")}
-
     annotation_field_ids = completeness.get("fields", [])
     field_definitions = []
     seen_ids = set()
@@ -935,15 +1300,14 @@ async def get_detailed_stats():
     for field_id in annotation_field_ids:
         if not field_id or field_id in seen_ids:
             continue
-        template_field = next((f for f in template_fields if f.get("id") == field_id), None)
+        template_field = template_by_id.get(field_id)
         if template_field:
             field_definitions.append(template_field)
         else:
-            values = [record.get(field_id) for record in annotated_records]
             field_definitions.append({
                 "id": field_id,
                 "label": field_id,
-                "type": _guess_field_type(values),
+                "type": _guess_field_type(columns.get(field_id, missing_column)),
             })
         seen_ids.add(field_id)
 
@@ -958,11 +1322,7 @@ async def get_detailed_stats():
         return (template_order.get(fid, len(template_order)), fid)
 
     field_definitions.sort(key=_field_sort_key)
-    completed_records = [
-        record
-        for record in annotated_records
-        if _is_record_complete(record, annotation_field_ids)
-    ]
+    completed_records = completeness["completed_records"]
 
     for field_def in field_definitions:
         field_id = field_def.get("id")
@@ -971,7 +1331,7 @@ async def get_detailed_stats():
 
         field_label = field_def.get("label") or field_id
         field_type = (field_def.get("type") or "").lower()
-        field_values = [record.get(field_id) for record in annotated_records]
+        field_values = columns.get(field_id, missing_column)
         if field_type not in ("boolean", "select", "checklist"):
             field_type = _guess_field_type(field_values)
 
@@ -1091,17 +1451,10 @@ async def get_detailed_stats():
                 })
             continue
 
-        counter = Counter()
-        for value in field_values:
-            normalized_value = (
-                _normalize_bool_value(value)
-                if field_type == "boolean"
-                else _normalize_field_value(value)
-            )
-            if not normalized_value:
-                continue
-            counter[normalized_value] += 1
-
+        counter = _count_values(
+            field_values,
+            _normalize_bool_value if field_type == "boolean" else _normalize_field_value,
+        )
         if not counter:
             continue
 
@@ -1114,18 +1467,9 @@ async def get_detailed_stats():
             "total": sum(counter.values()),
         })
 
-    for record in annotated_records:
-        doc_type = record.get("attribute_docType")
-        if doc_type:
-            doc_type_counts[doc_type] += 1
-
-        annotator = record.get("Annotator") or record.get("annotator")
-        if annotator:
-            annotator_counts[annotator] += 1
-        
-        dataset = record.get("Dataset") or record.get("dataset") or getattr(state, "currentDataset", "")
-        if dataset:
-            dataset_counts[dataset] += 1
+    doc_type_counts = completeness["doc_type_counts"]
+    annotator_counts = completeness["annotator_counts"]
+    dataset_counts = completeness["dataset_counts"]
 
     leaderboard = [{"annotator": a, "count": c} for a, c in annotator_counts.most_common()]
     overall_counts_serialized = {key: dict(counter) for key, counter in overall_counts.items()}
@@ -1151,33 +1495,33 @@ async def get_detailed_stats():
 @router.get("/api/reviews")
 async def get_reviews_data():
     """Fetches ALL review items from the 'Reviews' worksheet."""
+    return await asyncio.to_thread(_build_reviews_data)
+
+
+def _build_reviews_data():
     reviews_ws = _get_reviews_worksheet()
     if not reviews_ws:
         return {"rows": []}
     
     try:
-        review_records = reviews_ws.get_all_records()
+        review_values, sheet_values = _batch_get_all_values(reviews_ws, state.worksheet)
+        review_records = _records_from_values(review_values)
 
         # Build a lookup of the latest sheet values by DOI for quick comparisons.
-        sheet_records = _get_all_records()
+        try:
+            sheet_records = _records_from_values(sheet_values)
+        except Exception as e:
+            print(f"ERROR: Could not fetch records from Google Sheet: {e}")
+            sheet_records = []
         sheet_lookup = {}
+        # Every sheet record shares the header row, so work out the DOI-bearing columns once.
+        doi_headers = _doi_headers(tuple(sheet_records[0])) if sheet_records else ()
         for record in sheet_records:
-            doi_value = _extract_doi(record)
+            doi_value = _extract_doi(record, doi_headers)
             normalized_doi = _normalize_doi(doi_value)
             if normalized_doi and normalized_doi not in sheet_lookup:
-                normalized_map = {}
-                for header, value in record.items():
-                    norm_key = _normalize_header_key(header)
-                    if norm_key and norm_key not in normalized_map:
-                        normalized_map[norm_key] = value
-                entry = {
-                    "raw": record,
-                    "normalized": normalized_map
-                }
-                sheet_lookup[normalized_doi] = entry
-                if doi_value:
-                    sheet_lookup[str(doi_value).strip()] = entry
-                    sheet_lookup[str(doi_value).strip().lower()] = entry
+                # The normalized-key view is only built for rows a review actually looks up.
+                sheet_lookup[normalized_doi] = {"raw": record, "normalized": None}
 
         for record in review_records:
             doi_value = record.get("DOI") or record.get("doi")
@@ -1189,29 +1533,10 @@ async def get_reviews_data():
             status_reason = "row_not_found"
 
             if normalized_doi and trigger_name:
-                sheet_entry = (
-                    sheet_lookup.get(normalized_doi)
-                    or sheet_lookup.get(str(doi_value).strip() if doi_value else None)
-                    or sheet_lookup.get(str(doi_value).strip().lower() if doi_value else None)
-                )
-                if sheet_entry is None:
-                    for candidate_record in sheet_records:
-                        candidate_doi = _extract_doi(candidate_record)
-                        if _normalize_doi(candidate_doi) == normalized_doi:
-                            normalized_map = {}
-                            for header, value in candidate_record.items():
-                                norm_key = _normalize_header_key(header)
-                                if norm_key and norm_key not in normalized_map:
-                                    normalized_map[norm_key] = value
-                            sheet_entry = {
-                                "raw": candidate_record,
-                                "normalized": normalized_map,
-                            }
-                            sheet_lookup[normalized_doi] = sheet_entry
-                            break
+                sheet_entry = sheet_lookup.get(normalized_doi)
                 if sheet_entry is not None:
                     raw_row = sheet_entry["raw"]
-                    normalized_row = sheet_entry["normalized"]
+                    normalized_row = _normalized_row(sheet_entry)
                     status_reason = "column_not_found"
                     candidate_headers = []
                     for key in (
@@ -1232,94 +1557,46 @@ async def get_reviews_data():
                             isinstance(dynamic_key, str)
                             and dynamic_value
                             and dynamic_key.endswith(("_Field", "_Column"))
-                            and dynamic_value not in candidate_headers
                         ):
                             candidate_headers.append(dynamic_value)
 
-                    candidate_headers.extend(
-                        [
-                            "Human_Label",
-                            "human_label",
-                            "Human Label",
-                            trigger_name,
-                        ]
-                    )
-
-                    if trigger_name:
-                        trigger_base = str(trigger_name).strip()
-                        trigger_lower = trigger_base.lower()
-                        trigger_no_space = trigger_lower.replace(" ", "_")
-                        trigger_no_dash = trigger_no_space.replace("-", "_")
-                        trigger_variants = {
-                            trigger_base,
-                            trigger_lower,
-                            trigger_no_space,
-                            trigger_no_dash,
-                            f"trigger_{trigger_base}",
-                            f"trigger_{trigger_lower}",
-                            f"trigger_{trigger_no_space}",
-                            f"trigger_{trigger_no_dash}",
-                            f"Trigger_{trigger_base}",
-                            f"Trigger_{trigger_lower}",
-                            f"Trigger_{trigger_no_space}",
-                            f"Trigger_{trigger_no_dash}",
-                        }
-                        candidate_headers.extend([v for v in trigger_variants if v])
+                    candidate_headers.extend(_HUMAN_LABEL_HEADERS)
+                    candidate_headers.append(trigger_name)
+                    candidate_headers.extend(_trigger_variants(str(trigger_name)))
 
                     candidate_headers.extend(
                         _candidate_columns_from_trigger(trigger_name)
                     )
 
-                    seen_candidates = set()
-                    deduped_candidates = []
-                    for cand in candidate_headers:
-                        if cand and cand not in seen_candidates:
-                            deduped_candidates.append(cand)
-                            seen_candidates.add(cand)
-                    candidate_headers = deduped_candidates
+                    # Strip once while deduplicating, so the search loop below works on clean names.
+                    candidate_headers = [
+                        cand for cand in dict.fromkeys(str(cand).strip() for cand in candidate_headers if cand) if cand
+                    ]
 
                     for candidate in candidate_headers:
-                        if not candidate:
-                            continue
-                        candidate_str = str(candidate).strip()
-                        if not candidate_str:
-                            continue
-                        if candidate_str in raw_row:
-                            current_value = raw_row.get(candidate_str)
-                            located_field = candidate_str
+                        if candidate in raw_row:
+                            current_value = raw_row[candidate]
+                            located_field = candidate
                         else:
-                            norm_key = _normalize_header_key(candidate_str)
-                            if norm_key and norm_key in normalized_row:
-                                current_value = normalized_row[norm_key]
-                                located_field = _first_header_with_norm(raw_row, norm_key) or candidate_str
+                            pair = normalized_row.get(_normalize_header_key(candidate))
+                            if pair is not None:
+                                located_field, current_value = pair
                         if current_value is not None:
                             break
 
                     if current_value is None:
-                        norm_trigger = _normalize_header_key(trigger_name)
-                        if norm_trigger and norm_trigger in normalized_row:
-                            current_value = normalized_row[norm_trigger]
-                            located_field = next(
-                                (hdr for hdr in raw_row.keys() if _normalize_header_key(hdr) == norm_trigger),
-                                trigger_name,
-                            )
-                    if current_value is None and trigger_name:
-                        norm_trigger = _normalize_header_key(trigger_name)
-                        if norm_trigger:
-                            for header, value in raw_row.items():
-                                if _normalize_header_key(header) == norm_trigger:
-                                    current_value = value
-                                    located_field = header
-                                    break
-                    if current_value is None and trigger_name:
+                        # Fall back to the trigger name itself: an exact normalized match first,
+                        # then the first header whose normalized name contains it.
                         norm_trigger = _normalize_header_key(trigger_name)
                         if norm_trigger:
-                            for header, value in raw_row.items():
-                                header_norm = _normalize_header_key(header)
-                                if header_norm and norm_trigger in header_norm:
-                                    current_value = value
-                                    located_field = header
-                                    break
+                            pair = normalized_row.get(norm_trigger)
+                            if pair is None:
+                                pair = next(
+                                    (pair for header_norm, pair in normalized_row.items() if norm_trigger in header_norm),
+                                    None,
+                                )
+                            if pair is not None:
+                                located_field, current_value = pair
 
                     if current_value is not None:
                         ai_label = record.get("AI_Label")
@@ -1349,42 +1626,46 @@ async def get_reviews_data():
 
 @router.post("/api/reviews/resolve")
 async def resolve_review_item(request: ResolveReviewRequest):
+    return await asyncio.to_thread(_resolve_review_item_sync, request)
+
+
+def _resolve_review_item_sync(request: ResolveReviewRequest):
     reviews_ws = _get_reviews_worksheet()
     if not reviews_ws:
         raise HTTPException(status_code=404, detail="Reviews worksheet not found.")
 
     try:
-        all_values = reviews_ws.get_all_values()
-        if not all_values:
+        headers = reviews_ws.row_values(1)
+        if not headers:
             raise HTTPException(status_code=404, detail="Review item not found.")
 
-        headers = all_values[0]
-        records_data = all_values[1:]
-
         doi_col_idx = headers.index("DOI")
         trigger_col_idx = headers.index("Trigger_Name")
         status_col_idx = headers.index("Review_Status") + 1
         reviewer_col_idx = headers.index("Reviewed_By") + 1
         reasoning_col_idx = headers.index("Reviewer_Reasoning") + 1
 
-        for i, record_row in enumerate(records_data):
-            if record_row[doi_col_idx] == request.doi and record_row[trigger_col_idx] == request.trigger_name:
-                row_to_update = i + 2
-                
-                updates = []
-                # CORRECTED: Use gspread.utils to get A1 notation for the range
-                status_range = gspread.utils.rowcol_to_a1(row_to_update, status_col_idx)
-                reviewer_range = gspread.utils.rowcol_to_a1(row_to_update, reviewer_col_idx)
+        # Only the DOI and trigger columns are needed to find the row, so fetch just those.
+        doi_values, trigger_values = fetch_data_columns(reviews_ws, [doi_col_idx + 1, trigger_col_idx + 1])
+        for i, (doi, trigger) in enumerate(zip_longest(doi_values, trigger_values, fillvalue=''), start=2):
+            if doi == request.doi and trigger == request.trigger_name:
+                row_to_update = i
                 
-                updates.append({'range': status_range, 'values': [[request.resolution]]})
-                updates.append({'range': reviewer_range, 'values': [[request.reviewed_by]]})
-
+                columns = [(status_col_idx, request.resolution), (reviewer_col_idx, request.reviewed_by)]
                 if request.reasoning is not None:
-                    reasoning_range = gspread.utils.rowcol_to_a1(row_to_update, reasoning_col_idx)
-                    updates.append({'range': reasoning_range, 'values': [[request.reasoning]]})
-                
-                if updates:
-                    reviews_ws.batch_update(updates, value_input_option='USER_ENTERED')
+                    columns.append((reasoning_col_idx, request.reasoning))
+                col_numbers = [col for col, _ in columns]
+                if col_numbers == list(range(col_numbers[0], col_numbers[0] + len(col_numbers))):
+                    # Adjacent columns (the default Reviews layout) are written as one row range.
+                    start = gspread.utils.rowcol_to_a1(row_to_update, col_numbers[0])
+                    end = gspread.utils.rowcol_to_a1(row_to_update, col_numbers[-1])
+                    updates = [{'range': f"{start}:{end}", 'values': [[value for _, value in columns]]}]
+                else:
+                    updates = [
+                        {'range': gspread.utils.rowcol_to_a1(row_to_update, col), 'values': [[value]]}
+                        for col, value in columns
+                    ]
+                reviews_ws.batch_update(updates, value_input_option='USER_ENTERED')
                 
                 return {"status": "success", "message": "Review status updated."}
         
@@ -1395,45 +1676,83 @@ async def resolve_review_item(request: ResolveReviewRequest):
         raise HTTPException(status_code=500, detail=f"Failed to update review status: {e}")
 
 
+_HUMAN_LABEL_HEADERS = ("Human_Label", "human_label", "Human Label")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Every ASCII byte except a-z and 0-9, for the translate() fast path of _normalize_header_key.
+_NON_ALNUM_BYTES = bytes(b for b in range(128) if not (48 <= b <= 57 or 97 <= b <= 122))
+_ALNUM_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Keywords in a trigger name that point at one of the standard trigger columns.
+_TRIGGER_KEYWORD_COLUMNS = (
+    ("human", "trigger_humans"),
+    ("animal", "trigger_animals"),
+    ("experimental", "trigger_experimental"),
+    ("experiment", "trigger_experimental"),
+    ("intervention", "trigger_experimental"),
+    ("personal", "trigger_PersonalSensitiveData"),
+    ("sensitive", "trigger_PersonalSensitiveData"),
+    ("data", "trigger_PersonalSensitiveData"),
+)
+# One scan for all keywords; the lookahead lets overlapping keywords all be found.
+_TRIGGER_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in _TRIGGER_KEYWORD_COLUMNS) + "))"
+)
+
+
+@lru_cache(maxsize=256)
+def _trigger_variants(trigger_name: str) -> tuple:
+    """Spellings a trigger's sheet column may use, bare and with a trigger_/Trigger_ prefix."""
+    base = trigger_name.strip()
+    lower = base.lower()
+    no_space = lower.replace(" ", "_")
+    no_dash = no_space.replace("-", "_")
+    forms = (base, lower, no_space, no_dash)
+    variants = forms + tuple(f"trigger_{form}" for form in forms) + tuple(f"Trigger_{form}" for form in forms)
+    return tuple(v for v in dict.fromkeys(variants) if v)
+
+
+# Sized to hold every header, candidate column name and trigger spelling seen in a
+# reviews request, so wide sheets don't evict entries mid-request.
+@lru_cache(maxsize=4096)
 def _normalize_header_key(key: Optional[str]) -> str:
     if key is None:
         return ""
-    return re.sub(r"[^a-z0-9]+", "", str(key).lower())
-
-
-def _first_header_with_norm(row: dict, normalized_key: str) -> Optional[str]:
-    for header in row.keys():
-        if _normalize_header_key(header) == normalized_key:
-            return header
-    return None
-
-
-def _candidate_columns_from_trigger(trigger_name: Optional[str]) -> list[str]:
+    lowered = str(key).lower()
+    if lowered.isascii():
+        return lowered.encode("ascii").translate(None, _NON_ALNUM_BYTES).decode("ascii")
+    return _NON_ALNUM_RE.sub("", lowered)
+
+
+def _normalized_row(sheet_entry: dict) -> dict:
+    """Returns the row as normalized header -> (header, value), first header winning, built on first use."""
+    normalized_map = sheet_entry["normalized"]
+    if normalized_map is None:
+        normalized_map = {}
+        for header, value in sheet_entry["raw"].items():
+            norm_key = _normalize_header_key(header)
+            if norm_key and norm_key not in normalized_map:
+                normalized_map[norm_key] = (header, value)
+        sheet_entry["normalized"] = normalized_map
+    return normalized_map
+
+
+@lru_cache(maxsize=512)
+def _candidate_columns_from_trigger(trigger_name: Optional[str]) -> tuple[str, ...]:
     if not trigger_name:
-        return []
+        return ()
 
     base = trigger_name.strip()
     if not base:
-        return []
+        return ()
 
     candidates = []
     lower = base.lower()
 
-    keyword_map = [
-        ("human", "trigger_humans"),
-        ("animal", "trigger_animals"),
-        ("experimental", "trigger_experimental"),
-        ("experiment", "trigger_experimental"),
-        ("intervention", "trigger_experimental"),
-        ("personal", "trigger_PersonalSensitiveData"),
-        ("sensitive", "trigger_PersonalSensitiveData"),
-        ("data", "trigger_PersonalSensitiveData"),
-    ]
-    for keyword, column in keyword_map:
-        if keyword in lower:
-            candidates.append(column)
+    found = {m.group(1) for m in _TRIGGER_KEYWORD_RE.finditer(lower)}
+    if found:
+        candidates.extend(column for keyword, column in _TRIGGER_KEYWORD_COLUMNS if keyword in found)
 
-    tokens = re.findall(r"[a-z0-9]+", lower)
+    tokens = _ALNUM_TOKEN_RE.findall(lower)
     if tokens:
         underscore = "_".join(tokens)
         camel = "".join(token.capitalize() for token in tokens)
@@ -1443,13 +1762,7 @@ def _candidate_columns_from_trigger(trigger_name: Optional[str]) -> list[str]:
     candidates.append(f"trigger_{lower}")
 
     # Remove duplicates while preserving order
-    seen = set()
-    ordered = []
-    for cand in candidates:
-        if cand and cand not in seen:
-            ordered.append(cand)
-            seen.add(cand)
-    return ordered
+    return tuple(cand for cand in dict.fromkeys(candidates) if cand)
 
 
 def _normalize_doi(value: Optional[str]) -> Optional[str]:
@@ -1471,12 +1784,18 @@ def _normalize_doi(value: Optional[str]) -> Optional[str]:
     return normalized or None
 
 
-def _extract_doi(record: dict) -> Optional[str]:
+def _doi_headers(headers: tuple) -> tuple:
+    """Headers whose normalized name mentions "doi", in column order."""
+    return tuple(header for header in headers if "doi" in _normalize_header_key(header))
+
+
+def _extract_doi(record: dict, doi_headers: Optional[tuple] = None) -> Optional[str]:
     if not record:
         return None
-    for key, value in record.items():
-        norm_key = _normalize_header_key(key)
-        if norm_key.endswith("doi") or "doi" in norm_key:
-            if value:
-                return str(value).strip()
+    if doi_headers is None:
+        doi_headers = _doi_headers(tuple(record))
+    for key in doi_headers:
+        value = record.get(key)
+        if value:
+            return str(value).strip()
     return None
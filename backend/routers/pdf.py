@@ -1,18 +1,68 @@
 # backend/routers/pdf.py
 import asyncio
+import os
 import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lhtml
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import Response
+from fastapi.responses import FileResponse
 
 from models import PdfRequest
-from config import PDF_DIR
+from config import PDF_DIR, PDF_PROBE_CONCURRENCY
 
 router = APIRouter()
 
+# One pooled session for the process so repeat fetches from the same publisher reuse
+# connections (and TLS sessions) instead of handshaking on every download. Per-request
+# headers such as Referer are passed on each call rather than set on the session.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,application/pdf,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.8",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=32))
+
+_AUTHOR_STRIP_RE = re.compile(r'[^\w-]')
+_TITLE_STRIP_RE = re.compile(r'[^\w\s-]')
+_REFRESH_RE = re.compile(r"refresh", re.I)
+_META_REFRESH_URL_RE = re.compile(r"url=([^;]+)", re.I)
+_PDF_CHUNK_SIZE = 1 << 20
+# Ends in .pdf, or mentions /pdf, format=pdf, type=pdf or pdf= anywhere (case-insensitive).
+_PDF_URL_HINT_RE = re.compile(r"\.pdf\Z|/pdf|format=pdf|type=pdf|pdf=", re.I)
+
+_JS_PDF_URL_RE = re.compile(rb"""["']([^"'\s]{0,512}?(?:\.pdf\b|format=pdf|type=pdf|/pdf/)[^"'\s]*)["']""", re.I)
+
+# Attributes publishers use to carry a PDF link outside of href/src. Only these are
+# inspected, rather than every attribute of every element on the page.
+_PDF_DATA_ATTRS = (
+    "data-pdf-url",
+    "data-pdf",
+    "data-pdf-href",
+    "data-download-url",
+    "data-download",
+    "data-href",
+    "data-url",
+    "data-src",
+)
+_PDF_DATA_ATTR_XPATH = etree.XPath("//*[" + " or ".join(f"@{attr}" for attr in _PDF_DATA_ATTRS) + "]")
+_PDF_LINK_HREFS_XPATH = etree.XPath(
+    '//link[@href][translate(@type, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz") = "application/pdf"]/@href'
+)
+_ANCHORS_WITH_HREF_XPATH = etree.XPath("//a[@href]")
+
 @router.post("/download-pdf")
 async def download_pdf_proxy(request: PdfRequest):
     return await asyncio.to_thread(_download_pdf_sync, request)
@@ -24,25 +74,17 @@ def _download_pdf_sync(request: PdfRequest):
     print(f"LOG: Received request to download PDF from URL: {request.url}")
 
     # ---------- Filename as you had ----------
-    author = re.sub(r'[^\w-]', '', (request.author or "UnknownAuthor").encode('ascii', 'ignore').decode('ascii'))
-    title_fragment = "_".join(re.sub(r'[^\w\s-]', '', request.title or "untitled").strip().lower().split()[:4])
+    author = _AUTHOR_STRIP_RE.sub('', (request.author or "UnknownAuthor").encode('ascii', 'ignore').decode('ascii'))
+    title_fragment = "_".join(_TITLE_STRIP_RE.sub('', request.title or "untitled").strip().lower().split()[:4])
     filename = f"{author}{request.year or 'UnknownYear'}-{title_fragment}.pdf"
     filepath = PDF_DIR / filename
 
     if filepath.exists():
-        with open(filepath, "rb") as f:
-            return Response(content=f.read(), media_type="application/pdf", headers={"X-Saved-Filename": filename})
+        return FileResponse(filepath, media_type="application/pdf", headers={"X-Saved-Filename": filename})
 
     # ---------- Helpers ----------
     def looks_like_pdf_url(u: str) -> bool:
-        u_lower = u.lower()
-        return (
-            u_lower.endswith(".pdf")
-            or "/pdf" in u_lower
-            or "format=pdf" in u_lower
-            or "type=pdf" in u_lower
-            or "pdf=" in u_lower
-        )
+        return _PDF_URL_HINT_RE.search(u) is not None
 
     def uniq(seq):
         seen = set()
@@ -67,10 +109,12 @@ def _download_pdf_sync(request: PdfRequest):
             return True
         return False
 
-    def fetch_and_confirm_pdf(session: requests.Session, url: str, referer: str) -> bytes | None:
+    def fetch_and_confirm_pdf(session: requests.Session, url: str, referer: str):
+        # Returns (response, chunks, first_chunk) for a confirmed PDF, with the body still
+        # streaming, or None. Only the first chunk is read here to sniff the magic header.
         # Try HEAD first when server allows it, then GET
         try:
-            h = session.head(url, allow_redirects=True, timeout=30)
+            h = session.head(url, allow_redirects=True, timeout=30, headers={"Referer": referer})
             if h.status_code == 405:  # method not allowed
                 h = None
         except requests.RequestException:
@@ -79,104 +123,146 @@ def _download_pdf_sync(request: PdfRequest):
         if h is not None:
             if "application/pdf" in (h.headers.get("Content-Type") or "").lower():
                 try:
-                    g = session.get(url, allow_redirects=True, timeout=60, headers={"Referer": referer})
+                    g = session.get(url, allow_redirects=True, timeout=60, headers={"Referer": referer}, stream=True)
                     g.raise_for_status()
                     # No need to re-check headers; we trust HEAD
-                    return g.content
+                    chunks = g.iter_content(_PDF_CHUNK_SIZE)
+                    return g, chunks, next(chunks, b"")
                 except requests.RequestException:
                     return None
 
         try:
-            g = session.get(url, allow_redirects=True, timeout=60, headers={"Referer": referer})
+            g = session.get(url, allow_redirects=True, timeout=60, headers={"Referer": referer}, stream=True)
             g.raise_for_status()
+            # Sniff a few bytes to confirm PDF even if ctype is odd
+            chunks = g.iter_content(_PDF_CHUNK_SIZE)
+            first_chunk = next(chunks, b"")
         except requests.RequestException:
             return None
 
-        # Sniff a few bytes to confirm PDF even if ctype is odd
-        content = g.content
-        if is_pdf_response(g, sniff_bytes=content[:5]) and (is_pdf_bytes(content[:5]) or "application/pdf" in (g.headers.get("Content-Type") or "").lower()):
-            return content
+        if is_pdf_response(g, sniff_bytes=first_chunk[:5]) and (is_pdf_bytes(first_chunk[:5]) or "application/pdf" in (g.headers.get("Content-Type") or "").lower()):
+            return g, chunks, first_chunk
+        g.close()
         return None
 
-    # ---------- Session with browser-ish headers ----------
+    def close_probe(future):
+        if not future.cancelled() and future.exception() is None and future.result():
+            future.result()[0].close()
+
+    def probe_candidates(session: requests.Session, candidates: list, referer: str):
+        # Probes run concurrently in batches so one slow or dead link doesn't hold up the
+        # rest; the first confirmed PDF wins. Returns (stream or None, last_error).
+        last_error = None
+        pool = ThreadPoolExecutor(max_workers=PDF_PROBE_CONCURRENCY)
+        try:
+            for start in range(0, len(candidates), PDF_PROBE_CONCURRENCY):
+                batch = candidates[start:start + PDF_PROBE_CONCURRENCY]
+                futures = [pool.submit(fetch_and_confirm_pdf, session, cand, referer) for cand in batch]
+                for future in as_completed(futures):
+                    try:
+                        pdf_stream = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if pdf_stream:
+                        for other in futures:
+                            if other is not future:
+                                other.add_done_callback(close_probe)
+                        return pdf_stream, last_error
+        finally:
+            # Don't wait for slower probes once a PDF has been found.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None, last_error
+
+    def save_pdf_stream(resp: requests.Response, chunks, first_chunk: bytes) -> FileResponse:
+        # Writes the body to a temporary file next to the target and renames it into place,
+        # so memory stays flat for large PDFs and a failed download never leaves a partial file.
+        tmp_path = filepath.with_name(f".{filepath.name}.{uuid.uuid4().hex}.part")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(first_chunk)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, filepath)
+        finally:
+            resp.close()
+            tmp_path.unlink(missing_ok=True)
+        return FileResponse(filepath, media_type="application/pdf", headers={"X-Saved-Filename": filename})
+
+    # ---------- Shared session with browser-ish headers ----------
     url = str(request.url)
     parsed = urlparse(url)
     default_referer = f"{parsed.scheme}://{parsed.netloc}/"
 
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,application/pdf,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.8",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Referer": url,  # helps when the input is already a PDF URL (e.g., OUP)
-    })
+    session = _SESSION
 
     try:
         # 1) First request
-        r = session.get(url, allow_redirects=True, timeout=45)
+        # The Referer helps when the input is already a PDF URL (e.g., OUP)
+        r = session.get(url, allow_redirects=True, timeout=45, headers={"Referer": url}, stream=True)
         r.raise_for_status()
         ctype = (r.headers.get("Content-Type") or "").lower()
 
-        # 2) If it is already a PDF, save it
-        if "application/pdf" in ctype or (is_pdf_bytes(r.content[:5]) and "application/octet-stream" in ctype):
-            pdf_content = r.content
-            with open(filepath, "wb") as f:
-                f.write(pdf_content)
-            return Response(content=pdf_content, media_type="application/pdf", headers={"X-Saved-Filename": filename})
+        # 2) If it is already a PDF (by type or, for anything that isn't HTML, by sniffing), save it
+        if "text/html" not in ctype:
+            chunks = r.iter_content(_PDF_CHUNK_SIZE)
+            first_chunk = next(chunks, b"")
+            if "application/pdf" in ctype or is_pdf_bytes(first_chunk[:5]):
+                return save_pdf_stream(r, chunks, first_chunk)
+            r.close()
+            raise HTTPException(status_code=415, detail=f"URL did not point to a PDF. Content-Type: {ctype}")
 
         # 3) If HTML, mine for candidates
         if "text/html" in ctype:
-            soup = BeautifulSoup(r.text, "lxml")
+            try:
+                doc = lhtml.fromstring(r.content)
+            except (etree.ParserError, ValueError):  # empty or unparseable page
+                doc = None
             candidates = []
+            anchors = []
 
-            # (a) <link rel="alternate" type="application/pdf" href=...>
-            for link in soup.find_all("link", href=True):
-                if (link.get("type") or "").lower() == "application/pdf":
-                    candidates.append(urljoin(r.url, link["href"]))
-
-            # (b) <a href=...> if href or text indicates PDF
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                text = (a.get_text() or "").strip().lower()
-                if looks_like_pdf_url(href) or "pdf" in text:
+            if doc is not None:
+                # (a) <link rel="alternate" type="application/pdf" href=...>
+                for href in _PDF_LINK_HREFS_XPATH(doc):
                     candidates.append(urljoin(r.url, href))
 
-            # (c) Embedded viewers
-            for tag in soup.find_all(["iframe", "embed", "object"]):
-                for attr in ("src", "data"):
-                    val = tag.get(attr)
-                    if val and looks_like_pdf_url(val):
-                        candidates.append(urljoin(r.url, val))
-
-            # (d) Meta refresh → URL
-            meta = soup.find("meta", attrs={"http-equiv": re.compile(r"refresh", re.I)})
-            if meta and meta.get("content"):
-                m = re.search(r"url=([^;]+)", meta["content"], flags=re.I)
-                if m:
-                    candidates.append(urljoin(r.url, m.group(1).strip()))
-
-            # (e) Data attributes commonly used for PDF URLs
-            for tag in soup.find_all(attrs=True):
-                for k, v in list(tag.attrs.items()):
-                    if isinstance(v, str) and "pdf" in v.lower():
-                        candidates.append(urljoin(r.url, v))
-
-            # (f) JS literals with PDF-ish URLs
-            script_text = " ".join(s.get_text(" ", strip=True) for s in soup.find_all("script"))
-            for m in re.finditer(r"""["'](.*?)["']""", script_text):
-                s = m.group(1)
-                if looks_like_pdf_url(s):
-                    candidates.append(urljoin(r.url, s))
+                # (b) <a href=...> if href or text indicates PDF
+                anchors = _ANCHORS_WITH_HREF_XPATH(doc)
+                for a in anchors:
+                    href = a.get("href")
+                    text = (a.text_content() or "").strip().lower()
+                    if looks_like_pdf_url(href) or "pdf" in text:
+                        candidates.append(urljoin(r.url, href))
+
+                # (c) Embedded viewers
+                for tag in doc.iter("iframe", "embed", "object"):
+                    for attr in ("src", "data"):
+                        val = tag.get(attr)
+                        if val and looks_like_pdf_url(val):
+                            candidates.append(urljoin(r.url, val))
+
+                # (d) Meta refresh → URL
+                meta = next((m for m in doc.iter("meta") if _REFRESH_RE.search(m.get("http-equiv") or "")), None)
+                if meta is not None and meta.get("content"):
+                    m = _META_REFRESH_URL_RE.search(meta.get("content"))
+                    if m:
+                        candidates.append(urljoin(r.url, m.group(1).strip()))
+
+                # (e) Data attributes commonly used for PDF URLs
+                for tag in _PDF_DATA_ATTR_XPATH(doc):
+                    for attr in _PDF_DATA_ATTRS:
+                        v = tag.get(attr)
+                        if v and "pdf" in v.lower():
+                            candidates.append(urljoin(r.url, v))
+
+            # (f) JS literals with PDF-ish URLs, matched straight off the raw page bytes
+            page_encoding = r.encoding or "utf-8"
+            for m in _JS_PDF_URL_RE.finditer(r.content):
+                candidates.append(urljoin(r.url, m.group(1).decode(page_encoding, "replace")))
 
             # (g) DOI-style helpers (common publisher patterns)
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
+            for a in anchors:
+                href = a.get("href")
                 if "/doi/" in href and "pdf" not in href.lower():
                     # try common variants
                     base = urljoin(r.url, href)
@@ -186,18 +272,10 @@ def _download_pdf_sync(request: PdfRequest):
             # Deduplicate while preserving order
             candidates = list(uniq(candidates))
 
-            # Try each candidate
-            last_error = None
-            for cand in candidates:
-                try:
-                    pdf_bytes = fetch_and_confirm_pdf(session, cand, referer=r.url or default_referer)
-                    if pdf_bytes:
-                        with open(filepath, "wb") as f:
-                            f.write(pdf_bytes)
-                        return Response(content=pdf_bytes, media_type="application/pdf", headers={"X-Saved-Filename": filename})
-                except Exception as e:
-                    last_error = e
-                    continue
+            # Try the candidates, a few at a time
+            pdf_stream, last_error = probe_candidates(session, candidates, referer=r.url or default_referer)
+            if pdf_stream:
+                return save_pdf_stream(*pdf_stream)
 
             # If we got here, we failed to auto-discover a working PDF
             detail = "HTML page found, but no working PDF link could be confirmed."
@@ -208,15 +286,6 @@ def _download_pdf_sync(request: PdfRequest):
                 detail += f"\nLast error: {last_error}"
             raise HTTPException(status_code=415, detail=detail)
 
-        # 4) Unknown content type: still try to see if it’s a PDF by sniffing
-        if is_pdf_bytes(r.content[:5]):
-            pdf_content = r.content
-            with open(filepath, "wb") as f:
-                f.write(pdf_content)
-            return Response(content=pdf_content, media_type="application/pdf", headers={"X-Saved-Filename": filename})
-
-        raise HTTPException(status_code=415, detail=f"URL did not point to a PDF. Content-Type: {ctype}")
-
     except requests.exceptions.RequestException as e:
         raise HTTPException(status_code=400, detail=f"Failed to download PDF. Reason: {e}")
     except HTTPException:
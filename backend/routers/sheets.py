@@ -1,6 +1,10 @@
 # backend/routers/sheets.py
+import asyncio
+import copy
 import gspread
 import json
+import os
+import re
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import Any, Dict, List
@@ -13,18 +17,75 @@ from config import SHEETS_CONFIG_FILE
 
 router = APIRouter()
 
+# The spreadsheet ID in a Sheets URL; it stops at the next '/', '?' or '#'.
+_SHEET_ID_RE = re.compile(r"spreadsheets/d/([a-zA-Z0-9_-]+)")
+
 class TemplateUpdateRequest(BaseModel):
     template_data: Dict[str, Any] = Field(..., alias="templateData")
 
+# Parsed sheets config, re-read only when the file's mtime changes, plus the set of its sheet IDs.
+_SHEETS_CONFIG_CACHE = {"mtime_ns": None, "config": [], "ids": frozenset()}
+# Config file I/O runs off the event loop, so add/delete take this to keep their read-modify-write atomic.
+_SHEETS_CONFIG_GUARD = asyncio.Lock()
+
+def _refresh_sheets_config_cache():
+    """Re-reads the config file if it changed and returns the cache. Callers must not modify it."""
+    try:
+        mtime_ns = SHEETS_CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    if _SHEETS_CONFIG_CACHE["mtime_ns"] != mtime_ns:
+        config = []
+        if mtime_ns is not None:
+            with open(SHEETS_CONFIG_FILE, 'r') as f:
+                config = json.load(f)
+        _SHEETS_CONFIG_CACHE.update(mtime_ns=mtime_ns, config=config, ids=frozenset(s['id'] for s in config))
+    return _SHEETS_CONFIG_CACHE
+
 def _load_sheets_config():
-    if not SHEETS_CONFIG_FILE.exists():
-        return []
-    with open(SHEETS_CONFIG_FILE, 'r') as f:
-        return json.load(f)
+    # Callers modify the list they get back, so hand out a copy.
+    return copy.deepcopy(_refresh_sheets_config_cache()["config"])
 
 def _save_sheets_config(config):
-    with open(SHEETS_CONFIG_FILE, 'w') as f:
+    # Written next to the real file and renamed over it, so a crash mid-write never leaves
+    # a truncated config behind. Callers hold _SHEETS_CONFIG_GUARD, so one temp name is enough.
+    tmp_path = SHEETS_CONFIG_FILE.with_name(SHEETS_CONFIG_FILE.name + ".tmp")
+    with open(tmp_path, 'w') as f:
         json.dump(config, f, indent=2)
+    os.replace(tmp_path, SHEETS_CONFIG_FILE)
+    _SHEETS_CONFIG_CACHE.update(
+        mtime_ns=SHEETS_CONFIG_FILE.stat().st_mtime_ns,
+        config=copy.deepcopy(config),
+        ids=frozenset(s['id'] for s in config),
+    )
+
+# sheet_id -> the spreadsheet's Drive modifiedTime when its template was last read into
+# state.SHEET_TEMPLATES. Any edit to the spreadsheet bumps modifiedTime, so a match means
+# the cached template is still exactly what '_template'!A1 holds.
+_TEMPLATE_MODIFIED_TIMES: Dict[str, str] = {}
+
+def _cached_sheet_template(sheet_id: str, modified_time: str):
+    """Returns the cached template for the sheet if it was read at `modified_time`, else None."""
+    if _TEMPLATE_MODIFIED_TIMES.get(sheet_id) == modified_time:
+        return state.SHEET_TEMPLATES.get(sheet_id)
+    return None
+
+def _fetch_sheet_properties(spreadsheet: gspread.Spreadsheet) -> List[Dict[str, Any]]:
+    """Returns the properties of every worksheet, in order, from a single metadata request."""
+    metadata = spreadsheet.fetch_sheet_metadata(params={"fields": "sheets.properties"})
+    return [sheet["properties"] for sheet in metadata.get("sheets", [])]
+
+def _read_template_cell(spreadsheet: gspread.Spreadsheet):
+    """Reads '_template'!A1 directly by range, without resolving the worksheet first."""
+    response = spreadsheet.values_batch_get([gspread.utils.absolute_range_name("_template", "A1")])
+    values = response.get("valueRanges", [{}])[0].get("values")
+    return values[0][0] if values and values[0] else None
+
+# System/internal fields that never become SyntheticData columns.
+_SYNTHETIC_EXCLUDED_KEYS = frozenset({
+    'annotator', 'lock_annotator', 'lock_timestamp', 'status',
+    'latest_comment', 'doi', 'title', 'dataset', ''
+})
 
 def write_synthetic_data(spreadsheet: gspread.Spreadsheet, data: List[Dict[str, Any]]):
     """
@@ -35,11 +96,15 @@ def write_synthetic_data(spreadsheet: gspread.Spreadsheet, data: List[Dict[str,
         print("WARN: No synthetic data provided to write.")
         return
 
-    try:
-        worksheet = spreadsheet.worksheet("SyntheticData")
-    except gspread.WorksheetNotFound:
-        print("LOG: 'SyntheticData' worksheet not found. Creating it.")
-        worksheet = spreadsheet.add_worksheet(title="SyntheticData", rows=1, cols=30)
+    worksheet_key = (spreadsheet.id, "SyntheticData")
+    worksheet = state.AUX_WORKSHEETS.get(worksheet_key)
+    if worksheet is None:
+        try:
+            worksheet = spreadsheet.worksheet("SyntheticData")
+        except gspread.WorksheetNotFound:
+            print("LOG: 'SyntheticData' worksheet not found. Creating it.")
+            worksheet = spreadsheet.add_worksheet(title="SyntheticData", rows=1, cols=30)
+        state.AUX_WORKSHEETS[worksheet_key] = worksheet
 
     existing_headers = worksheet.row_values(1)
     
@@ -47,14 +112,10 @@ def write_synthetic_data(spreadsheet: gspread.Spreadsheet, data: List[Dict[str,
     first_record_annotations = data[0].get("annotations", {})
     
     # --- FIX: Exclude system/internal fields from the header list ---
-    EXCLUDED_KEYS = [
-        'annotator', 'lock_annotator', 'lock_timestamp', 'status', 
-        'latest_comment', 'doi', 'title', 'dataset', ''
-    ]
     annotation_keys = [
         k for k in first_record_annotations.keys() 
         if (
-            k not in EXCLUDED_KEYS
+            k not in _SYNTHETIC_EXCLUDED_KEYS
             and '_context' not in k
             and '_reasoning' not in k
             and '_pdf_only' not in k
@@ -64,76 +125,85 @@ def write_synthetic_data(spreadsheet: gspread.Spreadsheet, data: List[Dict[str,
     ideal_headers = ["doi", "title", "abstract", "annotator", "dataset"] + sorted(annotation_keys)
     
     final_headers = []
+    header_row = []  # Written in the same append as the data when the sheet is empty
 
     if not existing_headers:
         print("LOG: 'SyntheticData' sheet is empty. Writing new headers.")
-        worksheet.append_row(ideal_headers, value_input_option='USER_ENTERED')
+        header_row = [ideal_headers]
         final_headers = ideal_headers
     else:
-        missing_headers = [h for h in ideal_headers if h not in existing_headers]
+        existing_header_set = set(existing_headers)
+        missing_headers = [h for h in ideal_headers if h not in existing_header_set]
         if missing_headers:
             print(f"LOG: Found missing headers: {missing_headers}. Appending to sheet.")
             
             # --- FIX: Explicitly add columns to the sheet before writing to them ---
-            worksheet.add_cols(len(missing_headers))
-            
-            start_cell = gspread.utils.rowcol_to_a1(1, len(existing_headers) + 1)
-            worksheet.update(start_cell, [missing_headers], value_input_option='USER_ENTERED')
+            # Growing the grid and writing the new header cells go out as one batchUpdate.
+            spreadsheet.batch_update({"requests": [
+                {"appendDimension": {"sheetId": worksheet.id, "dimension": "COLUMNS", "length": len(missing_headers)}},
+                {"updateCells": {
+                    "start": {"sheetId": worksheet.id, "rowIndex": 0, "columnIndex": len(existing_headers)},
+                    "rows": [{"values": [{"userEnteredValue": {"stringValue": h}} for h in missing_headers]}],
+                    "fields": "userEnteredValue",
+                }},
+            ]})
             final_headers = existing_headers + missing_headers
         else:
             final_headers = existing_headers
     
+    # All records share one shape, so decide once per header whether its value lives on the
+    # record itself or in its annotations, instead of two membership tests per cell.
+    header_sources = [(header, header in data[0]) for header in final_headers]
     rows_to_append = []
     for record in data:
-        row = []
         annotations = record.get("annotations", {})
-        for header in final_headers:
-            if header in record:
-                row.append(record[header])
-            elif header in annotations:
-                row.append(annotations[header])
-            else:
-                row.append("")
-        rows_to_append.append(row)
+        rows_to_append.append([
+            record.get(header, "") if on_record else annotations.get(header, "")
+            for header, on_record in header_sources
+        ])
 
     if rows_to_append:
-        worksheet.append_rows(rows_to_append, value_input_option='USER_ENTERED')
+        worksheet.append_rows(header_row + rows_to_append, value_input_option='USER_ENTERED')
         print(f"LOG: Successfully appended {len(rows_to_append)} rows to 'SyntheticData' sheet.")
 
 
 @router.get("/api/sheets", response_model=list)
 async def get_sheets():
-    return _load_sheets_config()
+    return await asyncio.to_thread(_load_sheets_config)
 
 @router.post("/api/sheets")
 async def add_sheet(request: SheetUrlRequest):
-    config = _load_sheets_config()
-    try:
-        if "spreadsheets/d/" in request.url:
-            sheet_id = request.url.split('spreadsheets/d/')[1].split('/')[0]
-        else:
-            raise ValueError("Invalid URL")
-    except (ValueError, IndexError):
+    match = _SHEET_ID_RE.search(request.url)
+    if not match:
         raise HTTPException(status_code=400, detail="Invalid Google Sheet URL provided.")
+    sheet_id = match.group(1)
 
-    if any(s['id'] == sheet_id for s in config):
-        raise HTTPException(status_code=409, detail="This sheet has already been added.")
-    
-    config.append({"id": sheet_id, "name": request.name})
-    _save_sheets_config(config)
+    async with _SHEETS_CONFIG_GUARD:
+        cached = await asyncio.to_thread(_refresh_sheets_config_cache)
+        if sheet_id in cached["ids"]:
+            raise HTTPException(status_code=409, detail="This sheet has already been added.")
+
+        # _save_sheets_config copies what it caches, so building a new list is enough here.
+        config = cached["config"] + [{"id": sheet_id, "name": request.name}]
+        await asyncio.to_thread(_save_sheets_config, config)
     return {"status": "success", "id": sheet_id}
 
 @router.delete("/api/sheets/{sheet_id}")
 async def delete_sheet(sheet_id: str):
-    config = _load_sheets_config()
-    new_config = [s for s in config if s['id'] != sheet_id]
-    if len(new_config) == len(config):
-        raise HTTPException(status_code=404, detail="Sheet configuration not found.")
-    _save_sheets_config(new_config)
+    async with _SHEETS_CONFIG_GUARD:
+        cached = await asyncio.to_thread(_refresh_sheets_config_cache)
+        if sheet_id not in cached["ids"]:
+            raise HTTPException(status_code=404, detail="Sheet configuration not found.")
+        new_config = [s for s in cached["config"] if s['id'] != sheet_id]
+        await asyncio.to_thread(_save_sheets_config, new_config)
     return {"status": "success"}
 
 @router.post("/connect-to-sheet")
 async def connect_to_sheet(request: ConnectSheetRequest):
+    return await asyncio.to_thread(_connect_to_sheet_sync, request)
+
+
+def _connect_to_sheet_sync(request: ConnectSheetRequest):
     if not state.gspread_client:
         raise HTTPException(status_code=503, detail="Google Sheets client not initialized.")
     
@@ -143,28 +213,43 @@ async def connect_to_sheet(request: ConnectSheetRequest):
 
     try:
         spreadsheet = state.gspread_client.open_by_key(sheet_id)
-        state.worksheet = spreadsheet.sheet1
+        # One metadata read resolves the first worksheet and tells us whether '_template' exists,
+        # instead of a separate metadata fetch for each worksheet lookup.
+        sheet_properties = _fetch_sheet_properties(spreadsheet)
+        if not sheet_properties:
+            raise gspread.WorksheetNotFound("index 0 not found")
+        state.spreadsheet = spreadsheet
+        state.worksheet = gspread.Worksheet(spreadsheet, sheet_properties[0], spreadsheet.id, spreadsheet.client)
+        state.AUX_WORKSHEETS.clear()
         print(f"LOG: Successfully connected to sheet '{spreadsheet.title}'")
 
         try:
-            template_worksheet = spreadsheet.worksheet("_template")
-            template_json_str = template_worksheet.acell('A1').value
-            if template_json_str:
-                parsed_template = json.loads(template_json_str)
-                if 'fields' in parsed_template and isinstance(parsed_template['fields'], list):
-                    state.SHEET_TEMPLATES[sheet_id] = parsed_template
-                    has_sheet_template = True
-                    spreadsheet.fetch_sheet_metadata()
-                    template_timestamp = spreadsheet.lastUpdateTime
-                    print(f"LOG: Found and loaded a valid template from worksheet '_template' in sheet '{spreadsheet.title}'.")
-                else:
-                    print(f"WARN: Content in '_template' sheet is not a valid template format (missing 'fields' list).")
+            if not any(props.get("title") == "_template" for props in sheet_properties):
+                raise gspread.WorksheetNotFound("_template")
+            modified_time = spreadsheet.lastUpdateTime
+            if _cached_sheet_template(sheet_id, modified_time) is not None:
+                has_sheet_template = True
+                template_timestamp = modified_time
+                print(f"LOG: Sheet '{spreadsheet.title}' is unchanged since its template was loaded. Reusing it.")
             else:
-                 print(f"LOG: Found '_template' worksheet but cell A1 is empty.")
+                template_json_str = _read_template_cell(spreadsheet)
+                if template_json_str:
+                    parsed_template = json.loads(template_json_str)
+                    if 'fields' in parsed_template and isinstance(parsed_template['fields'], list):
+                        state.SHEET_TEMPLATES[sheet_id] = parsed_template
+                        _TEMPLATE_MODIFIED_TIMES[sheet_id] = modified_time
+                        has_sheet_template = True
+                        template_timestamp = modified_time
+                        print(f"LOG: Found and loaded a valid template from worksheet '_template' in sheet '{spreadsheet.title}'.")
+                    else:
+                        print(f"WARN: Content in '_template' sheet is not a valid template format (missing 'fields' list).")
+                else:
+                     print(f"LOG: Found '_template' worksheet but cell A1 is empty.")
         except gspread.WorksheetNotFound:
             print(f"LOG: No '_template' worksheet found in sheet '{spreadsheet.title}'. Using local templates.")
             if sheet_id in state.SHEET_TEMPLATES:
                 del state.SHEET_TEMPLATES[sheet_id]
+            _TEMPLATE_MODIFIED_TIMES.pop(sheet_id, None)
         except json.JSONDecodeError:
             print(f"WARN: Could not parse JSON from '_template' worksheet cell A1.")
         except Exception as e:
@@ -206,12 +291,16 @@ async def connect_to_sheet(request: ConnectSheetRequest):
 
 @router.get("/api/sheets/{sheet_id}/template-status")
 async def get_sheet_template_status(sheet_id: str):
+    return await asyncio.to_thread(_get_sheet_template_status_sync, sheet_id)
+
+
+def _get_sheet_template_status_sync(sheet_id: str):
     if not state.gspread_client:
         raise HTTPException(status_code=503, detail="Google Sheets client not initialized.")
     try:
         spreadsheet = state.gspread_client.open_by_key(sheet_id)
-        spreadsheet.fetch_sheet_metadata() 
-        spreadsheet.worksheet("_template")
+        if not any(props.get("title") == "_template" for props in _fetch_sheet_properties(spreadsheet)):
+            raise gspread.WorksheetNotFound("_template")
         return {"last_updated": spreadsheet.lastUpdateTime}
     except gspread.WorksheetNotFound:
         raise HTTPException(status_code=404, detail="No template worksheet found for this sheet.")
@@ -222,16 +311,30 @@ async def get_sheet_template_status(sheet_id: str):
 
 @router.get("/api/sheets/{sheet_id}/template")
 async def get_sheet_template(sheet_id: str):
+    return await asyncio.to_thread(_get_sheet_template_sync, sheet_id)
+
+
+def _get_sheet_template_sync(sheet_id: str):
     print(f"LOG: Live-fetching template for sheet {sheet_id}.")
     if not state.gspread_client:
         raise HTTPException(status_code=503, detail="Google Sheets client not initialized.")
     try:
         spreadsheet = state.gspread_client.open_by_key(sheet_id)
-        template_worksheet = spreadsheet.worksheet("_template")
-        template_json_str = template_worksheet.acell('A1').value
+        modified_time = spreadsheet.lastUpdateTime
+        cached_template = _cached_sheet_template(sheet_id, modified_time)
+        if cached_template is not None:
+            return cached_template
+        try:
+            template_json_str = _read_template_cell(spreadsheet)
+        except APIError:
+            # A range on a missing worksheet fails to parse; only then pay for a metadata read.
+            if not any(props.get("title") == "_template" for props in _fetch_sheet_properties(spreadsheet)):
+                raise gspread.WorksheetNotFound("_template")
+            raise
         if template_json_str:
             parsed_template = json.loads(template_json_str)
             state.SHEET_TEMPLATES[sheet_id] = parsed_template
+            _TEMPLATE_MODIFIED_TIMES[sheet_id] = modified_time
             return parsed_template
         else:
             raise HTTPException(status_code=404, detail="Template worksheet is empty.")
@@ -243,6 +346,10 @@ async def get_sheet_template(sheet_id: str):
 
 @router.post("/api/sheets/{sheet_id}/template")
 async def save_sheet_template(sheet_id: str, request: TemplateUpdateRequest):
+    return await asyncio.to_thread(_save_sheet_template_sync, sheet_id, request)
+
+
+def _save_sheet_template_sync(sheet_id: str, request: TemplateUpdateRequest):
     if not state.gspread_client:
         raise HTTPException(status_code=503, detail="Google Sheets client not initialized.")
 
@@ -259,6 +366,8 @@ async def save_sheet_template(sheet_id: str, request: TemplateUpdateRequest):
         
         template_worksheet.update_cell(1, 1, template_json_str)
         state.SHEET_TEMPLATES[sheet_id] = request.template_data
+        # The write bumps modifiedTime to a value we haven't read, so the next fetch re-validates.
+        _TEMPLATE_MODIFIED_TIMES.pop(sheet_id, None)
         
         print(f"LOG: Successfully saved template to sheet '{spreadsheet.title}'.")
         return {"status": "success", "message": "Template saved to Google Sheet successfully."}
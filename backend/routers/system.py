@@ -2,6 +2,7 @@
 import os
 import sys
 import subprocess
+import time
 from pathlib import Path
 
 import requests
@@ -11,11 +12,36 @@ from dotenv import set_key, find_dotenv, load_dotenv
 from models import ApiKeyRequest
 from ai_requests import configure_genai
 from utils import get_local_git_hash, open_folder
-from config import DATA_DIR
+from config import DATA_DIR, UPDATE_CHECK_CACHE_SECONDS
 
 # Create a router to hold all system-related endpoints
 router = APIRouter()
 
+# Last main-branch commit hash fetched from GitHub. It is reused for UPDATE_CHECK_CACHE_SECONDS,
+# then re-validated with If-None-Match: an unchanged branch answers 304, which GitHub doesn't
+# count against the unauthenticated rate limit.
+_REMOTE_HASH_CACHE = {"etag": None, "sha": None, "fetched_at": 0.0}
+
+
+def _get_remote_main_hash():
+    if _REMOTE_HASH_CACHE["sha"] and time.time() - _REMOTE_HASH_CACHE["fetched_at"] < UPDATE_CHECK_CACHE_SECONDS:
+        return _REMOTE_HASH_CACHE["sha"]
+
+    repo_url = "https://api.github.com/repos/scottkryski/Scribe/branches/main"
+    headers = {}
+    if _REMOTE_HASH_CACHE["etag"] and _REMOTE_HASH_CACHE["sha"]:
+        headers["If-None-Match"] = _REMOTE_HASH_CACHE["etag"]
+    response = requests.get(repo_url, headers=headers, timeout=5)
+    if response.status_code == 304:
+        _REMOTE_HASH_CACHE["fetched_at"] = time.time()
+        return _REMOTE_HASH_CACHE["sha"]
+    response.raise_for_status()
+
+    remote_hash = response.json().get("commit", {}).get("sha")
+    if remote_hash:
+        _REMOTE_HASH_CACHE.update(etag=response.headers.get("ETag"), sha=remote_hash, fetched_at=time.time())
+    return remote_hash
+
 
 @router.post("/save-api-key")
 def save_api_key(request: ApiKeyRequest):
@@ -67,12 +93,7 @@ def check_for_updates():
         return {"update_available": False, "message": "Not a Git repository."}
 
     try:
-        repo_url = "https://api.github.com/repos/scottkryski/Scribe/branches/main"
-        response = requests.get(repo_url, timeout=5)
-        response.raise_for_status()
-        
-        remote_data = response.json()
-        remote_hash = remote_data.get("commit", {}).get("sha")
+        remote_hash = _get_remote_main_hash()
 
         if not remote_hash:
             raise HTTPException(status_code=500, detail="Could not parse remote commit hash.")
@@ -1,6 +1,9 @@
+import asyncio
 import json
 import re
 import os
+import shutil
+import uuid
 from fastapi import APIRouter, HTTPException, Request, UploadFile, File
 
 from config import TEMPLATES_DIR
@@ -8,15 +11,32 @@ from utils import open_folder
 
 router = APIRouter()
 
+_TEMPLATE_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+\.json$")
+
+def _validate_template_name(template_name: str):
+    if not _TEMPLATE_NAME_RE.match(template_name):
+        raise HTTPException(status_code=400, detail="Invalid template name.")
+
+# Sorted template file names, re-listed only when the directory's mtime changes (a file was
+# added, removed or renamed) or after one of the endpoints below changed the folder.
+_TEMPLATE_NAMES_CACHE = {"mtime_ns": None, "names": []}
+
+def _invalidate_template_names():
+    _TEMPLATE_NAMES_CACHE["mtime_ns"] = None
+
 @router.get("/api/templates")
 def get_templates():
-    if not TEMPLATES_DIR.exists(): return []
-    return sorted([f.name for f in TEMPLATES_DIR.glob("*.json")])
+    try:
+        mtime_ns = TEMPLATES_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if _TEMPLATE_NAMES_CACHE["mtime_ns"] != mtime_ns:
+        _TEMPLATE_NAMES_CACHE.update(mtime_ns=mtime_ns, names=sorted(f.name for f in TEMPLATES_DIR.glob("*.json")))
+    return list(_TEMPLATE_NAMES_CACHE["names"])
 
 @router.get("/api/templates/{template_name}")
 def get_template(template_name: str):
-    if not re.match(r"^[a-zA-Z0-9_-]+\.json$", template_name):
-        raise HTTPException(status_code=400, detail="Invalid template name.")
+    _validate_template_name(template_name)
     file_path = TEMPLATES_DIR / template_name
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Template not found.")
@@ -25,24 +45,33 @@ def get_template(template_name: str):
 
 @router.post("/api/templates/{template_name}")
 async def save_template(template_name: str, request: Request):
-    if not re.match(r"^[a-zA-Z0-9_-]+\.json$", template_name):
-        raise HTTPException(status_code=400, detail="Invalid template name.")
+    _validate_template_name(template_name)
     file_path = TEMPLATES_DIR / template_name
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(await request.json(), f, indent=4)
+        await asyncio.to_thread(_save_template_sync, file_path, await request.json())
+        _invalidate_template_names()
         return {"status": "success", "filename": template_name}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving template file: {e}")
 
+def _save_template_sync(file_path, data):
+    # Same write-then-rename as uploads, so a failed save leaves the previous template intact.
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.part")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
 @router.delete("/api/templates/{template_name}")
 def delete_template(template_name: str):
-    if not re.match(r"^[a-zA-Z0-9_-]+\.json$", template_name):
-        raise HTTPException(status_code=400, detail="Invalid template name.")
+    _validate_template_name(template_name)
     file_path = TEMPLATES_DIR / template_name
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Template not found.")
     os.remove(file_path)
+    _invalidate_template_names()
     return {"status": "success", "filename": template_name}
 
 @router.post("/open-templates-folder")
@@ -55,11 +84,23 @@ async def upload_template(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="Invalid file type. Please upload a .json file.")
     file_path = TEMPLATES_DIR / file.filename
     try:
-        contents = await file.read()
-        json.loads(contents) # Validate JSON
-        with open(file_path, "wb") as f: f.write(contents)
+        await asyncio.to_thread(_store_uploaded_template_sync, file_path, file.file)
+        _invalidate_template_names()
         return {"status": "success", "filename": file.filename}
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON format.")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error saving file: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error saving file: {e}")
+
+def _store_uploaded_template_sync(file_path, source):
+    # Validates straight from the spooled upload, then copies it in chunks to a temporary file
+    # that is renamed into place, so a bad or interrupted upload never clobbers a template.
+    json.load(source) # Validate JSON
+    source.seek(0)
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.part")
+    try:
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(source, f, 1 << 16)
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -1,18 +1,116 @@
 # backend/utils.py
 import subprocess
+import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import os
 import sys
+import gspread.utils
+
+LOCK_TIMESTAMP_FORMAT = '%m/%d/%Y - %I:%M:%S %p'
+
+def get_human_readable_timestamp() -> str:
+    """Formats the current local time the way comment timestamps are stored in the sheet."""
+    return time.strftime(LOCK_TIMESTAMP_FORMAT)
+
+def get_lock_timestamp() -> str:
+    """Returns the current time as whole epoch seconds, the format new lock_timestamp cells are written in."""
+    return str(int(time.time()))
+
+def _parse_fixed_ts(ts_str: str) -> Optional[float]:
+    """
+    Parses 'MM/DD/YYYY - HH:MM:SS AM' by slicing at fixed offsets, which is much cheaper
+    than strptime. Returns None for anything that isn't exactly that zero-padded shape.
+    """
+    if len(ts_str) != 24 or ts_str[2] != '/' or ts_str[5] != '/' or ts_str[10:13] != ' - ' or ts_str[21] != ' ':
+        return None
+    meridiem = ts_str[22:]
+    if meridiem not in ('AM', 'PM'):
+        return None
+    try:
+        hour = int(ts_str[13:15])
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+        return datetime(
+            int(ts_str[6:10]), int(ts_str[0:2]), int(ts_str[3:5]),
+            hour, int(ts_str[16:18]), int(ts_str[19:21]),
+        ).timestamp()
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096)
+def parse_lock_timestamp(ts_str: str) -> Optional[float]:
+    """
+    Converts a lock timestamp (epoch seconds, or the legacy human-readable format) to
+    epoch seconds. Returns None if the value cannot be parsed. Results are memoized
+    because every dashboard refresh re-reads the same lock cells.
+    """
+    try:
+        return float(ts_str)
+    except ValueError:
+        pass
+    ts = _parse_fixed_ts(ts_str)
+    if ts is not None:
+        return ts
+    try:
+        return datetime.strptime(ts_str, LOCK_TIMESTAMP_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+# HEAD's commit hash, keyed on the mtimes of the files it was resolved from.
+_GIT_HASH_CACHE = {"key": None, "hash": None}
+
+def _mtime_ns(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _read_git_head(git_dir: Path, head: str) -> Optional[str]:
+    """Resolves the contents of .git/HEAD to a commit hash by reading the repository files
+    directly. Returns None for layouts it doesn't handle (the caller then runs `git rev-parse`)."""
+    if not head.startswith("ref: "):
+        return head or None  # Detached HEAD holds the hash itself
+    ref = head[len("ref: "):]
+    ref_file = git_dir / ref
+    if ref_file.is_file():
+        return ref_file.read_text().strip() or None
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    return None
 
 def get_local_git_hash():
     """Gets the git hash of the local repository."""
-    print("LOG: Attempting to get local git hash.")
     try:
         project_root = Path(__file__).parent.parent
-        if not (project_root / ".git").exists():
+        git_dir = project_root / ".git"
+        if not git_dir.exists():
              print("LOG: No .git directory found. Not a git repository.")
              return "nogit"
 
+        # HEAD, the branch ref and packed-refs are the only files a commit, checkout or pull
+        # changes for this lookup, so the hash is re-resolved only when one of them does.
+        if git_dir.is_dir():
+            head_path = git_dir / "HEAD"
+            head = head_path.read_text().strip()
+            ref_path = git_dir / head[len("ref: "):] if head.startswith("ref: ") else head_path
+            cache_key = (_mtime_ns(head_path), _mtime_ns(ref_path), _mtime_ns(git_dir / "packed-refs"), head)
+            if _GIT_HASH_CACHE["key"] == cache_key:
+                return _GIT_HASH_CACHE["hash"]
+            git_hash = _read_git_head(git_dir, head)
+            if git_hash:
+                _GIT_HASH_CACHE.update(key=cache_key, hash=git_hash)
+                print(f"LOG: Successfully found local git hash: {git_hash}")
+                return git_hash
+
+        print("LOG: Attempting to get local git hash.")
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
             capture_output=True,
@@ -23,7 +121,7 @@ def get_local_git_hash():
         git_hash = result.stdout.strip()
         print(f"LOG: Successfully found local git hash: {git_hash}")
         return git_hash
-    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         print(f"LOG: Could not get git hash. Reason: {e}")
         return "nogit"
 
@@ -41,4 +139,15 @@ def open_folder(path: Path):
         return {"status": "success", "path": str(path)}
     except Exception as e:
         print(f"ERROR: Failed to open folder: {e}")
-        return {"status": "error", "message": str(e)}
\ No newline at end of file
+        return {"status": "error", "message": str(e)}
+
+def fetch_data_columns(worksheet, columns) -> list[list]:
+    """Reads the given 1-based columns below the header row in one batch_get; trailing blanks are trimmed."""
+    ranges = []
+    for col in columns:
+        letter = gspread.utils.rowcol_to_a1(1, col)[:-1]
+        ranges.append(f"{letter}2:{letter}")
+    return [
+        value_range[0] if value_range else []
+        for value_range in worksheet.batch_get(ranges, major_dimension="COLUMNS")
+    ]